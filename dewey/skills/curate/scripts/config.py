@@ -7,13 +7,13 @@ from pathlib import Path
 def read_knowledge_dir(knowledge_base_root: Path) -> str:
     """Return the knowledge directory name from config, defaulting to 'docs'."""
     config_path = knowledge_base_root / ".dewey" / "config.json"
-    if config_path.exists():
-        try:
-            value = json.loads(config_path.read_text()).get("knowledge_dir", "docs")
-            return value.strip("/") or "docs"
-        except (json.JSONDecodeError, OSError):
-            return "docs"
-    return "docs"
+    # A missing file surfaces as FileNotFoundError (an OSError), so no
+    # separate exists() stat is needed; json.loads takes the bytes directly
+    try:
+        value = json.loads(config_path.read_bytes()).get("knowledge_dir", "docs")
+        return value.strip("/") or "docs"
+    except (json.JSONDecodeError, OSError):
+        return "docs"
 
 
 def write_config(knowledge_base_root: Path, knowledge_dir: str = "docs") -> Path:
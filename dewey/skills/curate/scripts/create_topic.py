@@ -8,8 +8,10 @@ from __future__ import annotations
 from pathlib import Path
 
 from config import read_knowledge_dir
+from scaffold import _write_if_missing
 from templates import (
     _slugify,
+    _today,
     render_topic_md,
     render_topic_ref_md,
 )
@@ -44,18 +46,17 @@ def create_topic(knowledge_base_root: Path, area: str, topic_name: str, relevanc
         raise FileNotFoundError(f"Domain area directory does not exist: {area_dir}")
 
     slug = _slugify(topic_name)
+    today = _today()
     created: list[str] = []
 
     # Working-knowledge topic file
     topic_path = area_dir / f"{slug}.md"
-    if not topic_path.exists():
-        topic_path.write_text(render_topic_md(topic_name, relevance))
+    if _write_if_missing(topic_path, render_topic_md(topic_name, relevance, today=today)):
         created.append(str(topic_path.relative_to(knowledge_base_root)))
 
     # Expert-reference companion
     ref_path = area_dir / f"{slug}.ref.md"
-    if not ref_path.exists():
-        ref_path.write_text(render_topic_ref_md(topic_name, relevance))
+    if _write_if_missing(ref_path, render_topic_ref_md(topic_name, relevance, today=today)):
         created.append(str(ref_path.relative_to(knowledge_base_root)))
 
     # Summary
@@ -11,6 +11,9 @@ from pathlib import Path
 
 from config import read_knowledge_dir
 
+_PROPOSAL_FIELDS = frozenset({"status", "proposed_by", "rationale"})
+_FM_KEY_RE = re.compile(r"^(\w+):")
+
 
 def _strip_proposal_fields(content: str) -> str:
     """Remove proposal-specific frontmatter fields from file content.
@@ -33,8 +36,8 @@ def _strip_proposal_fields(content: str) -> str:
             continue
 
         if in_frontmatter:
-            match = re.match(r"^(\w+):", line)
-            if match and match.group(1) in ("status", "proposed_by", "rationale"):
+            match = _FM_KEY_RE.match(line)
+            if match and match.group(1) in _PROPOSAL_FIELDS:
                 continue
 
         result.append(line)
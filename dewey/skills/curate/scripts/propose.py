@@ -8,6 +8,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from config import read_knowledge_dir
+from scaffold import _write_if_missing
 from templates import (
     _slugify,
     render_proposal_md,
@@ -56,13 +57,12 @@ def create_proposal(
     slug = _slugify(topic_name)
     proposal_path = proposals_dir / f"{slug}.md"
 
-    if not proposal_path.exists():
-        proposal_path.write_text(
-            render_proposal_md(topic_name, relevance, proposed_by, rationale)
-        )
-        return f"Proposal created: {knowledge_dir}/_proposals/{slug}.md"
+    if not _write_if_missing(
+        proposal_path, render_proposal_md(topic_name, relevance, proposed_by, rationale),
+    ):
+        return f"Proposal '{topic_name}' already exists — nothing created."
 
-    return f"Proposal '{topic_name}' already exists — nothing created."
+    return f"Proposal created: {knowledge_dir}/_proposals/{slug}.md"
 
 
 if __name__ == "__main__":
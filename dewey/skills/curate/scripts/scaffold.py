@@ -6,10 +6,15 @@ using marker-based managed sections.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
+import os
 import re
-import sys
+import stat
+import tempfile
 from pathlib import Path
+from typing import Iterator
 
 from config import read_knowledge_dir, write_config
 from templates import (
@@ -27,39 +32,121 @@ from templates import (
     render_overview_md,
 )
 
+# Plugin root (dewey/) -- scripts/ -> curate/ -> skills/ -> dewey/; resolved once
+_PLUGIN_ROOT = str(Path(__file__).resolve().parents[3])
 
-def _read_topic_metadata(file_path: Path) -> dict:
-    """Read a single .md file's depth from frontmatter and title from the first H1.
+_DEPTH_RE = re.compile(r"^depth:\s*(.+)$", re.MULTILINE)
+_H1_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+# AGENTS.md managed section: "### Area" headings or "| [name](path) | desc |" rows
+_AGENTS_MANAGED_RE = re.compile(
+    r"^### (.+)$|^\| \[(.+?)\]\((.+?)\) \| (.+?) \|$", re.MULTILINE
+)
+_LAST_UPDATED_RE = re.compile(r"last_updated: \d{4}-\d{2}-\d{2}")
+# The "# Role:" heading sits at the top of AGENTS.md; stop looking after this
+_ROLE_SCAN_LINES = 100
 
-    Returns ``{"name": str, "depth": str}`` or empty dict if the file
-    cannot be read.
+# Frontmatter and the first H1 almost always fit in the first few KiB
+_HEADER_CHARS = 4096
+
+
+def _split_frontmatter(text: str) -> tuple[str | None, int]:
+    """Locate a leading ``---`` fenced frontmatter block with plain finds.
+
+    Returns ``(frontmatter, body_start)``: the text between the fences
+    (ending in a newline) and the offset just past the closing fence, or
+    ``(None, 0)`` when *text* has no closed frontmatter.
+    """
+    if not text.startswith("---\n"):
+        return None, 0
+    close = text.find("\n---\n", 4)
+    if close == -1:
+        return None, 0
+    return text[4:close + 1], close + 5
+
+
+def _header_complete(text: str) -> bool:
+    """Return True when *text* holds the closed frontmatter and a full H1 line."""
+    frontmatter, body_start = _split_frontmatter(text)
+    if frontmatter is None and text.startswith("---\n"):
+        return False
+    heading_match = _H1_RE.search(text, body_start)
+    return heading_match is not None and heading_match.end() < len(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_topic_metadata_cached(path_str: str, mtime_ns: int, size: int) -> tuple[str, str] | None:
+    """Parse ``(name, depth)`` from a topic file, memoized on its stat signature.
+
+    *mtime_ns* and *size* are part of the cache key only, so an edited
+    file is re-read while unchanged files are served from memory across
+    repeated ``scaffold_knowledge_base`` / ``rebuild_index`` calls.  Call
+    ``_read_topic_metadata_cached.cache_clear()`` to drop all entries.
+
+    Returns None if the file cannot be read.
     """
     try:
-        text = file_path.read_text()
+        with open(path_str) as fh:
+            text = fh.read(_HEADER_CHARS)
+            # Only read the rest when the header spills past the window
+            if len(text) == _HEADER_CHARS and not _header_complete(text):
+                text += fh.read()
     except OSError:
-        return {}
+        return None
 
     # Extract depth from YAML frontmatter (between --- fences)
     depth = ""
-    fm_match = re.match(r"^---\n(.*?\n)---\n", text, re.DOTALL)
-    if fm_match:
-        depth_match = re.search(r"^depth:\s*(.+)$", fm_match.group(1), re.MULTILINE)
+    frontmatter, body_start = _split_frontmatter(text)
+    if frontmatter is not None:
+        depth_match = _DEPTH_RE.search(frontmatter)
         if depth_match:
             depth = depth_match.group(1).strip()
 
-    # Extract first H1 heading
+    # Extract first H1 heading after the frontmatter
     name = ""
-    heading_match = re.search(r"^# (.+)$", text, re.MULTILINE)
+    heading_match = _H1_RE.search(text, body_start)
     if heading_match:
         name = heading_match.group(1).strip()
 
+    return name, depth
+
+
+def _read_topic_metadata(file_path: str | os.PathLike | os.DirEntry) -> dict:
+    """Read a single .md file's depth from frontmatter and title from the first H1.
+
+    Accepts a ``Path``, a plain path string, or an ``os.DirEntry`` (whose
+    memoized ``stat()`` is reused for the cache key).  Results are cached by
+    path, modification time, and size.
+
+    Returns ``{"name": str, "depth": str}`` or empty dict if the file
+    cannot be read.
+    """
+    try:
+        if isinstance(file_path, os.DirEntry):
+            st = file_path.stat()
+        else:
+            st = os.stat(file_path)
+    except OSError:
+        return {}
+    meta = _read_topic_metadata_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size)
+    if meta is None:
+        return {}
+    name, depth = meta
     return {"name": name, "depth": depth}
 
 
 def _discover_index_data(knowledge_base_root: Path, knowledge_dir_name: str = "docs") -> list[dict]:
     """Scan the knowledge directory for all area subdirectories and their topics.
 
-    Returns a list of::
+    Materialized form of :func:`_iter_index_data`.
+    """
+    return list(_iter_index_data(knowledge_base_root, knowledge_dir_name))
+
+
+def _iter_index_data(knowledge_base_root: Path, knowledge_dir_name: str = "docs") -> Iterator[dict]:
+    """Yield each area subdirectory of the knowledge directory with its topics.
+
+    Areas are yielded one at a time so callers such as ``render_index_md``
+    never hold the whole tree in memory.  Each item is::
 
         {"name": str, "dirname": str, "topics": [{"name": str, "filename": str, "depth": str}]}
 
@@ -74,37 +161,49 @@ def _discover_index_data(knowledge_base_root: Path, knowledge_dir_name: str = "d
     """
     knowledge_path = knowledge_base_root / knowledge_dir_name
     if not knowledge_path.is_dir():
-        return []
+        return
 
-    areas: list[dict] = []
-    for entry in sorted(knowledge_path.iterdir()):
-        if not entry.is_dir():
-            continue
+    # os.scandir answers is_dir()/is_file() from the directory listing, so
+    # only the files we actually open cost an extra syscall.
+    with os.scandir(knowledge_path) as it:
+        area_entries = sorted(it, key=lambda e: e.name)
+
+    for entry in area_entries:
         # Skip underscore-prefixed directories like _proposals
         if entry.name.startswith("_"):
             continue
+        if not entry.is_dir():
+            continue
 
         dirname = entry.name
 
+        # Single pass over the listing: pick out overview.md and keep
+        # only topic files (no .ref.md), so only matches get sorted.
+        overview_entry: os.DirEntry | None = None
+        topic_entries: list[os.DirEntry] = []
+        with os.scandir(entry.path) as it:
+            for e in it:
+                name = e.name
+                if not name.endswith(".md") or not e.is_file():
+                    continue
+                if name == "overview.md":
+                    overview_entry = e
+                elif not name.endswith(".ref.md"):
+                    topic_entries.append(e)
+        topic_entries.sort(key=lambda e: e.name)
+
         # Read area name from overview.md (fall back to dirname)
-        overview_path = entry / "overview.md"
         area_name = dirname
-        if overview_path.is_file():
-            meta = _read_topic_metadata(overview_path)
-            if meta.get("name"):
-                area_name = meta["name"]
+        if overview_entry is not None:
+            overview_meta = _read_topic_metadata(overview_entry)
+            if overview_meta.get("name"):
+                area_name = overview_meta["name"]
 
         # Discover topics
         topics: list[dict] = []
-        for md_file in sorted(entry.glob("*.md")):
-            fname = md_file.name
-            # Exclude overview.md and .ref.md files
-            if fname == "overview.md":
-                continue
-            if fname.endswith(".ref.md"):
-                continue
-
-            meta = _read_topic_metadata(md_file)
+        for md_entry in topic_entries:
+            fname = md_entry.name
+            meta = _read_topic_metadata(md_entry)
             topic_name = meta.get("name", "") if meta else ""
             if not topic_name:
                 # Fall back to filename stem (without .md)
@@ -117,13 +216,11 @@ def _discover_index_data(knowledge_base_root: Path, knowledge_dir_name: str = "d
                 "depth": topic_depth,
             })
 
-        areas.append({
+        yield {
             "name": area_name,
             "dirname": dirname,
             "topics": topics,
-        })
-
-    return areas
+        }
 
 
 def _parse_agents_topics(agents_content: str) -> dict[str, list[dict]]:
@@ -131,37 +228,58 @@ def _parse_agents_topics(agents_content: str) -> dict[str, list[dict]]:
 
     Returns mapping of area name -> list of {"name", "path", "description"}.
     """
-    if MARKER_BEGIN not in agents_content or MARKER_END not in agents_content:
+    begin = agents_content.find(MARKER_BEGIN)
+    if begin == -1:
+        return {}
+    end = agents_content.find(MARKER_END, begin + len(MARKER_BEGIN))
+    if end == -1:
         return {}
-    begin = agents_content.index(MARKER_BEGIN)
-    end = agents_content.index(MARKER_END)
-    managed = agents_content[begin:end]
 
     topics_by_area: dict[str, list[dict]] = {}
     current_area: str | None = None
-    for line in managed.split("\n"):
-        heading_match = re.match(r"^### (.+)$", line)
-        if heading_match:
-            current_area = heading_match.group(1)
+    # One regex pass over the managed region finds headings and rows alike;
+    # pos/endpos bound the scan without slicing the content.
+    for match in _AGENTS_MANAGED_RE.finditer(agents_content, begin, end):
+        if match.group(1) is not None:
+            current_area = match.group(1)
             topics_by_area[current_area] = []
-            continue
-        if current_area is not None:
-            row_match = re.match(r"^\| \[(.+?)\]\((.+?)\) \| (.+?) \|$", line)
-            if row_match:
-                topics_by_area[current_area].append({
-                    "name": row_match.group(1),
-                    "path": row_match.group(2),
-                    "description": row_match.group(3),
-                })
+        elif current_area is not None:
+            topics_by_area[current_area].append({
+                "name": match.group(2),
+                "path": match.group(3),
+                "description": match.group(4),
+            })
     return topics_by_area
 
 
-def _merge_curation_plan(existing_content: str, new_areas: list[dict]) -> str:
+def _iter_h2_titles(text: str) -> Iterator[str]:
+    """Yield the stripped title of every ``## `` line in *text*.
+
+    Jumps between headings with ``str.find`` rather than splitting the
+    whole document into a list of lines.
+    """
+    if text.startswith("## "):
+        start = 0
+    else:
+        found = text.find("\n## ")
+        start = found + 1 if found != -1 else -1
+    while start != -1:
+        line_end = text.find("\n", start)
+        if line_end == -1:
+            line_end = len(text)
+        yield text[start + 3:line_end].strip()
+        found = text.find("\n## ", line_end)
+        start = found + 1 if found != -1 else -1
+
+
+def _merge_curation_plan(
+    existing_content: str,
+    new_areas: list[dict],
+    *,
+    today: str | None = None,
+) -> str:
     """Merge new area sections into existing curation plan, preserving progress."""
-    existing_slugs: set[str] = set()
-    for line in existing_content.split("\n"):
-        if line.startswith("## "):
-            existing_slugs.add(line[3:].strip())
+    existing_slugs = set(_iter_h2_titles(existing_content))
 
     new_sections: list[str] = []
     for area in new_areas:
@@ -189,12 +307,67 @@ def _merge_curation_plan(existing_content: str, new_areas: list[dict]) -> str:
         return existing_content
 
     # Update last_updated in frontmatter
-    updated = re.sub(
-        r"last_updated: \d{4}-\d{2}-\d{2}",
-        f"last_updated: {_today()}",
-        existing_content,
-    )
-    return updated.rstrip("\n") + "\n\n" + "\n\n".join(new_sections) + "\n"
+    updated = _LAST_UPDATED_RE.sub(f"last_updated: {today or _today()}", existing_content)
+    return "".join((updated.rstrip("\n"), "\n\n", "\n\n".join(new_sections), "\n"))
+
+
+def _read_or_none(path: Path) -> str | None:
+    """Return the text of *path*, or None if it does not exist.
+
+    One ``open()`` instead of an ``exists()`` stat followed by a read.
+    """
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def _write_if_missing(path: Path, data: str) -> bool:
+    """Create *path* with *data* unless it already exists.
+
+    Uses exclusive-create mode so the existence check and the create are
+    a single syscall.  Returns True if the file was written.
+    """
+    try:
+        with open(path, "x") as fh:
+            fh.write(data)
+    except FileExistsError:
+        return False
+    return True
+
+
+def _atomic_write(path: Path, data: str) -> None:
+    """Replace *path* with *data* without ever leaving a partial file.
+
+    Symlinks are followed, so a linked AGENTS.md keeps its link and the
+    real file is updated.  The data goes to a uniquely named temp file in
+    the target's directory, which takes over the target's permission bits
+    and is fsynced before ``os.replace`` swaps it into place (atomic on
+    POSIX and Windows).
+    """
+    target = path.resolve()
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        # New file: the permissions a plain write_text() would have given it
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 def merge_managed_section(
@@ -212,30 +385,34 @@ def merge_managed_section(
     if existing_content is None:
         return full_template
 
-    if MARKER_BEGIN not in existing_content:
-        return (
-            existing_content.rstrip("\n")
-            + "\n\n"
-            + MARKER_BEGIN
-            + "\n"
-            + managed_section
-            + "\n"
-            + MARKER_END
-            + "\n"
-        )
+    begin_idx = existing_content.find(MARKER_BEGIN)
+    if begin_idx == -1:
+        return "".join((
+            existing_content.rstrip("\n"),
+            "\n\n",
+            MARKER_BEGIN,
+            "\n",
+            managed_section,
+            "\n",
+            MARKER_END,
+            "\n",
+        ))
 
     # Replace content between markers
-    begin_idx = existing_content.index(MARKER_BEGIN)
-    end_idx = existing_content.index(MARKER_END) + len(MARKER_END)
-    return (
-        existing_content[:begin_idx]
-        + MARKER_BEGIN
-        + "\n"
-        + managed_section
-        + "\n"
-        + MARKER_END
-        + existing_content[end_idx:]
-    )
+    end_idx = existing_content.find(MARKER_END, begin_idx + len(MARKER_BEGIN))
+    if end_idx == -1:
+        raise ValueError(f"Found {MARKER_BEGIN} without a matching {MARKER_END}")
+    end_idx += len(MARKER_END)
+    # One join sizes the result once instead of copying through temporaries
+    return "".join((
+        existing_content[:begin_idx],
+        MARKER_BEGIN,
+        "\n",
+        managed_section,
+        "\n",
+        MARKER_END,
+        existing_content[end_idx:],
+    ))
 
 
 def scaffold_knowledge_base(
@@ -271,27 +448,34 @@ def scaffold_knowledge_base(
         domain_areas = []
 
     created: list[str] = []
+    # One date stamp for every file rendered in this scaffold run
+    today = _today()
 
     # ------------------------------------------------------------------
     # 1. Core directories
     # ------------------------------------------------------------------
     knowledge_path = target_dir / knowledge_dir
     proposals_dir = knowledge_path / "_proposals"
+    dewey_root = target_dir / ".dewey"
     dewey_dirs = [
-        target_dir / ".dewey" / "health",
-        target_dir / ".dewey" / "history",
-        target_dir / ".dewey" / "utilization",
+        dewey_root / "health",
+        dewey_root / "history",
+        dewey_root / "utilization",
     ]
 
+    # Only the knowledge dir may need its parents walked (it creates
+    # target_dir too); everything else is a single mkdir under a known parent.
+    knowledge_path.mkdir(parents=True, exist_ok=True)
+    proposals_dir.mkdir(exist_ok=True)
+    dewey_root.mkdir(exist_ok=True)
+    for d in dewey_dirs:
+        d.mkdir(exist_ok=True)
     for d in [knowledge_path, proposals_dir, *dewey_dirs]:
-        d.mkdir(parents=True, exist_ok=True)
         created.append(str(d.relative_to(target_dir)) + "/")
 
     # .gitkeep in empty .dewey subdirectories
     for d in dewey_dirs:
-        gitkeep = d / ".gitkeep"
-        if not gitkeep.exists():
-            gitkeep.touch()
+        _write_if_missing(d / ".gitkeep", "")
 
     # Write config
     write_config(target_dir, knowledge_dir)
@@ -300,30 +484,38 @@ def scaffold_knowledge_base(
     # ------------------------------------------------------------------
     # 2. Build domain-area metadata used by templates
     # ------------------------------------------------------------------
-    area_slugs: list[dict] = []
-    for name in domain_areas:
-        area_slugs.append({"name": name, "dirname": _slugify(name)})
-
-    # For AGENTS.md we need the slightly richer format (with topics list)
     # Discover existing topics from current AGENTS.md to preserve on re-init
     existing_topics: dict[str, list[dict]] = {}
     agents_path = target_dir / "AGENTS.md"
-    if agents_path.exists():
-        existing_topics = _parse_agents_topics(agents_path.read_text())
+    existing_agents = _read_or_none(agents_path)
+    if existing_agents is not None:
+        existing_topics = _parse_agents_topics(existing_agents)
+
+    # Slugify each area once; every later step derives from this list
+    area_info = [
+        {"name": name, "slug": _slugify(name), "topics": existing_topics.get(name, [])}
+        for name in domain_areas
+    ]
+    area_slugs = [{"name": a["name"], "dirname": a["slug"]} for a in area_info]
+    # For AGENTS.md we need the slightly richer format (with topics list)
+    agents_areas = [{"name": a["name"], "topics": a["topics"]} for a in area_info]
 
-    agents_areas: list[dict] = []
-    for name in domain_areas:
-        preserved = existing_topics.get(name, [])
-        agents_areas.append({"name": name, "topics": preserved})
+    # Areas with starter topics feed both the curation plan and the summary
+    plan_areas: list[dict] = []
+    if starter_topics:
+        plan_areas = [
+            {"name": a["name"], "slug": a["slug"], "starter_topics": starter_topics[a["name"]]}
+            for a in area_info
+            if starter_topics.get(a["name"])
+        ]
 
     # ------------------------------------------------------------------
     # 3. AGENTS.md (merge-safe)
     # ------------------------------------------------------------------
-    existing_agents = agents_path.read_text() if agents_path.exists() else None
     agents_section = render_agents_md_section(role_name, agents_areas, knowledge_dir=knowledge_dir)
     agents_full = render_agents_md(role_name, agents_areas, knowledge_dir=knowledge_dir)
     agents_new = merge_managed_section(existing_agents, agents_section, agents_full)
-    agents_path.write_text(agents_new)
+    _atomic_write(agents_path, agents_new)
     if existing_agents is None:
         created.append("AGENTS.md")
     else:
@@ -332,27 +524,30 @@ def scaffold_knowledge_base(
     # ------------------------------------------------------------------
     # 4. .claude/rules/dewey-kb.md (Dewey-owned, no merge needed)
     # ------------------------------------------------------------------
-    rules_dir = target_dir / ".claude" / "rules"
-    rules_dir.mkdir(parents=True, exist_ok=True)
+    claude_dir = target_dir / ".claude"
+    rules_dir = claude_dir / "rules"
+    claude_dir.mkdir(exist_ok=True)
+    rules_dir.mkdir(exist_ok=True)
     rules_path = rules_dir / "dewey-kb.md"
-    rules_path.write_text(
-        render_dewey_rules(role_name, area_slugs, knowledge_dir=knowledge_dir)
+    _atomic_write(
+        rules_path,
+        render_dewey_rules(role_name, area_slugs, knowledge_dir=knowledge_dir),
     )
     created.append(".claude/rules/dewey-kb.md")
 
     # ------------------------------------------------------------------
     # 5. Domain area directories + overview.md
     # ------------------------------------------------------------------
-    for name in domain_areas:
-        slug = _slugify(name)
+    for area in area_info:
+        name = area["name"]
+        slug = area["slug"]
         area_dir = knowledge_path / slug
-        area_dir.mkdir(parents=True, exist_ok=True)
+        area_dir.mkdir(exist_ok=True)
 
         overview_path = area_dir / "overview.md"
-        if not overview_path.exists():
-            overview_path.write_text(
-                render_overview_md(name, relevance="core", topics=[])
-            )
+        if _write_if_missing(
+            overview_path, render_overview_md(name, relevance="core", topics=[], today=today)
+        ):
             created.append(f"{knowledge_dir}/{slug}/overview.md")
 
     # ------------------------------------------------------------------
@@ -360,72 +555,72 @@ def scaffold_knowledge_base(
     # ------------------------------------------------------------------
     index_path = knowledge_path / "index.md"
     index_existed = index_path.exists()
-    index_data = _discover_index_data(target_dir, knowledge_dir)
-    # Fall back to area_slugs if no files on disk yet (fresh scaffold)
-    if not index_data:
+    index_areas = _iter_index_data(target_dir, knowledge_dir)
+    # Fall back to area_slugs if no files on disk yet (fresh scaffold);
+    # peek at the first area so the rest can still stream to the renderer
+    first_area = next(index_areas, None)
+    if first_area is None:
         index_data = area_slugs
-    index_path.write_text(render_index_md(role_name, index_data))
+    else:
+        index_data = itertools.chain((first_area,), index_areas)
+    _atomic_write(index_path, render_index_md(role_name, index_data))
     created.append(f"{knowledge_dir}/index.md" + (" (updated)" if index_existed else ""))
 
     # ------------------------------------------------------------------
     # 7. .claude/hooks.json (utilization tracking hook)
     # ------------------------------------------------------------------
-    hooks_path = target_dir / ".claude" / "hooks.json"
-    if not hooks_path.exists():
-        hooks_path.parent.mkdir(parents=True, exist_ok=True)
-        plugin_root = str(Path(__file__).resolve().parent.parent.parent.parent)
-        hooks_path.write_text(render_hooks_json(plugin_root, str(target_dir)))
+    hooks_path = claude_dir / "hooks.json"
+    if _write_if_missing(hooks_path, render_hooks_json(_PLUGIN_ROOT, str(target_dir))):
         created.append(".claude/hooks.json")
 
     # ------------------------------------------------------------------
     # 8. Curation plan (.dewey/curation-plan.md)
     # ------------------------------------------------------------------
-    if starter_topics:
-        plan_areas = []
-        for name in domain_areas:
-            topics = starter_topics.get(name, [])
-            if topics:
-                plan_areas.append({
-                    "name": name,
-                    "slug": _slugify(name),
-                    "starter_topics": topics,
-                })
-        if plan_areas:
-            plan_path = target_dir / ".dewey" / "curation-plan.md"
-            if plan_path.exists():
-                existing_plan = plan_path.read_text()
-                plan_path.write_text(_merge_curation_plan(existing_plan, plan_areas))
-                created.append(".dewey/curation-plan.md (updated)")
-            else:
-                plan_path.write_text(render_curation_plan_md(plan_areas))
-                created.append(".dewey/curation-plan.md")
+    if plan_areas:
+        plan_path = target_dir / ".dewey" / "curation-plan.md"
+        existing_plan = _read_or_none(plan_path)
+        if existing_plan is not None:
+            _atomic_write(plan_path, _merge_curation_plan(existing_plan, plan_areas, today=today))
+            created.append(".dewey/curation-plan.md (updated)")
+        else:
+            _atomic_write(plan_path, render_curation_plan_md(plan_areas, today=today))
+            created.append(".dewey/curation-plan.md")
 
     # ------------------------------------------------------------------
     # Summary
     # ------------------------------------------------------------------
-    summary_lines = [f"Scaffold created for '{role_name}':"]
-    for item in created:
-        summary_lines.append(f"  - {item}")
+    summary_lines = [f"Scaffold created for '{role_name}':", *["  - " + item for item in created]]
 
     # Curate plan (if starter topics provided)
     if starter_topics:
-        curate_areas = []
-        for name in domain_areas:
-            topics = starter_topics.get(name, [])
-            if topics:
-                curate_areas.append({
-                    "name": name,
-                    "slug": _slugify(name),
-                    "starter_topics": topics,
-                })
-        plan = render_curate_plan(curate_areas)
+        plan = render_curate_plan(plan_areas)
         if plan:
-            summary_lines.append("")
-            summary_lines.append(plan.rstrip("\n"))
+            summary_lines += ("", plan.rstrip("\n"))
 
     return "\n".join(summary_lines)
 
 
+def _read_role_name(agents_path: Path) -> str | None:
+    """Return the role from the ``# Role:`` heading of AGENTS.md, if present.
+
+    Reads line by line and gives up after ``_ROLE_SCAN_LINES`` lines rather
+    than loading the whole file.
+    """
+    try:
+        with open(agents_path) as fh:
+            for _ in range(_ROLE_SCAN_LINES):
+                line = fh.readline()
+                if not line:
+                    break
+                if line.startswith("# Role:"):
+                    role = line[7:].strip()
+                    if role:
+                        return role
+    except FileNotFoundError:
+        pass
+    return None
+
+
 def rebuild_index(target_dir: Path) -> str:
     """Regenerate index.md from the current filesystem contents.
 
@@ -444,17 +639,11 @@ def rebuild_index(target_dir: Path) -> str:
 
     # Read role name from AGENTS.md heading
     agents_path = target_dir / "AGENTS.md"
-    role_name = "Knowledge Base"
-    if agents_path.exists():
-        heading_match = re.search(
-            r"^# Role:\s*(.+)$", agents_path.read_text(), re.MULTILINE
-        )
-        if heading_match:
-            role_name = heading_match.group(1).strip()
+    role_name = _read_role_name(agents_path) or "Knowledge Base"
 
-    index_data = _discover_index_data(target_dir, knowledge_dir_name)
+    index_data = _iter_index_data(target_dir, knowledge_dir_name)
     index_path = knowledge_path / "index.md"
-    index_path.write_text(render_index_md(role_name, index_data))
+    _atomic_write(index_path, render_index_md(role_name, index_data))
     return f"{knowledge_dir_name}/index.md"
 
 
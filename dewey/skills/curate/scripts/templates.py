@@ -7,9 +7,11 @@ Managed sections are bracketed by MARKER_BEGIN / MARKER_END for safe merging.
 
 from __future__ import annotations
 
+import functools
+import io
 import json
-import re
 from datetime import date
+from typing import Iterable
 
 
 # ---------------------------------------------------------------------------
@@ -19,21 +21,48 @@ from datetime import date
 MARKER_BEGIN = "<!-- dewey:knowledge-base:begin -->"
 MARKER_END = "<!-- dewey:knowledge-base:end -->"
 
-
+# Two-line markdown table headers shared by several renderers
+_TOPIC_TABLE_HEADER = "| Topic | Description |\n|-------|-------------|"
+_DEPTH_TABLE_HEADER = "| Topic | Depth |\n|-------|-------|"
+
+# Static "How To Use This Knowledge" block of AGENTS.md; only the
+# knowledge directory name is substituted
+_AGENTS_USAGE_TEMPLATE = (
+    "## How To Use This Knowledge\n"
+    "- Load topic files from `{knowledge_dir}/` when the task relates to that domain area.\n"
+    "- Use `.ref.md` files for quick lookups; use full topic files for deep context.\n"
+    "- Cite primary sources from the `sources` frontmatter when making recommendations.\n"
+    "- Defer to primary sources for detailed reference.\n"
+    "- Check `.dewey/curation-plan.md` for planned topics and curation priorities.\n"
+    "- When a conversation touches knowledge areas not covered by existing topics or the plan, suggest adding them."
+)
+
+
+# ASCII translation table for _slugify: letters, digits and hyphens are kept,
+# whitespace and underscores become hyphens, everything else is dropped
+_SLUG_TABLE = {
+    code: ("-" if chr(code).isspace() or chr(code) == "_" else None)
+    for code in range(128)
+    if not (chr(code).isdigit() or "a" <= chr(code) <= "z" or chr(code) == "-")
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def _slugify(name: str) -> str:
     """Convert a human-readable name to a filename slug.
 
     Lowercases, replaces spaces and underscores with hyphens, strips
     non-alphanumeric characters (except hyphens), and collapses runs of
-    hyphens.
+    hyphens.  Memoized: area and topic names recur across renderers.
     """
-    slug = name.lower().strip()
-    slug = slug.replace("_", "-")
-    slug = re.sub(r"[^a-z0-9\s-]", "", slug)
-    slug = re.sub(r"[\s]+", "-", slug)
-    slug = re.sub(r"-{2,}", "-", slug)
-    slug = slug.strip("-")
-    return slug
+    slug = name.lower()
+    if not slug.isascii():
+        # Non-ASCII whitespace still separates words; other non-ASCII is dropped
+        slug = "".join(" " if c.isspace() else c for c in slug if c.isascii() or c.isspace())
+    slug = slug.translate(_SLUG_TABLE)
+    # Splitting on "-" and dropping empty parts collapses runs of hyphens
+    # and trims them from both ends in one step
+    return "-".join(filter(None, slug.split("-")))
 
 
 # ---------------------------------------------------------------------------
@@ -41,7 +70,11 @@ def _slugify(name: str) -> str:
 # ---------------------------------------------------------------------------
 
 def _today() -> str:
-    """ISO-formatted date string for today."""
+    """ISO-formatted date string for today.
+
+    Renderers that stamp a date accept ``today=`` so a caller producing a
+    batch of files can compute this once and pass it through.
+    """
     return date.today().isoformat()
 
 
@@ -59,6 +92,40 @@ def _frontmatter(fields: dict) -> str:
     return "\n".join(lines)
 
 
+def _topic_frontmatter(
+    relevance: str,
+    depth: str,
+    *,
+    today: str | None = None,
+    **extra: str,
+) -> str:
+    """Render the fixed-schema frontmatter shared by topic-like files.
+
+    Equivalent to ``_frontmatter`` with a placeholder source,
+    ``last_validated``, ``relevance`` and ``depth``, followed by any
+    *extra* fields in the order given.  *today* defaults to ``_today()``.
+    """
+    extra_lines = "".join(f"{key}: {value}\n" for key, value in extra.items())
+    return (
+        "---\n"
+        "sources:\n"
+        "  - url: <!-- Add primary source URL -->\n"
+        "    title: <!-- Add source title -->\n"
+        f"last_validated: {today or _today()}\n"
+        f'relevance: "{relevance}"\n'
+        f"depth: {depth}\n"
+        f"{extra_lines}"
+        "---"
+    )
+
+
+def _topic_link(topic: dict, area_path: str) -> str:
+    """Return the topic's explicit ``path`` or its default under *area_path*."""
+    if "path" in topic:
+        return topic["path"]
+    return f"{area_path}{_slugify(topic['name'])}.md"
+
+
 # ---------------------------------------------------------------------------
 # Public render functions
 # ---------------------------------------------------------------------------
@@ -69,20 +136,19 @@ def render_agents_md_section(role_name: str, domain_areas: list[dict], *, knowle
     Contains the "What You Have Access To" manifest and
     "How To Use This Knowledge" guidance.
     """
-    sections: list[str] = []
-
-    sections.append("## What You Have Access To")
+    sections: list[str] = ["## What You Have Access To"]
 
     for area in domain_areas:
         topics = area.get("topics", [])
         sections.append(f"### {area['name']}")
         if topics:
             sections.append("")
-            sections.append("| Topic | Description |")
-            sections.append("|-------|-------------|")
-            for topic in topics:
-                link = topic.get("path", f"{knowledge_dir}/{_slugify(area['name'])}/{_slugify(topic['name'])}.md")
-                sections.append(f"| [{topic['name']}]({link}) | {topic['description']} |")
+            sections.append(_TOPIC_TABLE_HEADER)
+            area_path = f"{knowledge_dir}/{_slugify(area['name'])}/"
+            sections.extend(
+                f"| [{topic['name']}]({_topic_link(topic, area_path)}) | {topic['description']} |"
+                for topic in topics
+            )
         sections.append("")
 
     # Remove trailing blank if domain_areas was non-empty
@@ -90,13 +156,7 @@ def render_agents_md_section(role_name: str, domain_areas: list[dict], *, knowle
         sections.pop()
 
     sections.append("")
-    sections.append("## How To Use This Knowledge")
-    sections.append(f"- Load topic files from `{knowledge_dir}/` when the task relates to that domain area.")
-    sections.append("- Use `.ref.md` files for quick lookups; use full topic files for deep context.")
-    sections.append("- Cite primary sources from the `sources` frontmatter when making recommendations.")
-    sections.append("- Defer to primary sources for detailed reference.")
-    sections.append("- Check `.dewey/curation-plan.md` for planned topics and curation priorities.")
-    sections.append("- When a conversation touches knowledge areas not covered by existing topics or the plan, suggest adding them.")
+    sections.append(_AGENTS_USAGE_TEMPLATE.format(knowledge_dir=knowledge_dir))
 
     return "\n".join(sections)
 
@@ -116,24 +176,22 @@ def render_agents_md(role_name: str, domain_areas: list[dict], *, knowledge_dir:
     knowledge_dir:
         Name of the knowledge directory (default: "docs").
     """
-    lines: list[str] = []
-
-    # User-owned section (outside markers)
-    lines.append(f"# Role: {role_name}")
-    lines.append("")
-    lines.append("## Who You Are")
-    lines.append("<!-- Describe the persona, tone, and expertise level -->")
-    lines.append("")
-
-    # Dewey-managed section (inside markers)
-    lines.append(MARKER_BEGIN)
-    lines.append(render_agents_md_section(role_name, domain_areas, knowledge_dir=knowledge_dir))
-    lines.append(MARKER_END)
-
-    return "\n".join(lines) + "\n"
-
-
-def render_index_md(role_name: str, domain_areas: list[dict]) -> str:
+    managed = render_agents_md_section(role_name, domain_areas, knowledge_dir=knowledge_dir)
+
+    # User-owned section (outside markers), then the dewey-managed section
+    return (
+        f"# Role: {role_name}\n"
+        "\n"
+        "## Who You Are\n"
+        "<!-- Describe the persona, tone, and expertise level -->\n"
+        "\n"
+        f"{MARKER_BEGIN}\n"
+        f"{managed}\n"
+        f"{MARKER_END}\n"
+    )
+
+
+def render_index_md(role_name: str, domain_areas: Iterable[dict]) -> str:
     """Render docs/index.md (human-readable TOC).
 
     No frontmatter — index.md is structural, not a knowledge topic.
@@ -143,32 +201,29 @@ def render_index_md(role_name: str, domain_areas: list[dict]) -> str:
     role_name:
         Included for context in the preamble.
     domain_areas:
-        List of ``{"name": "Area Name", "dirname": "area-name"}``.
+        Iterable of ``{"name": "Area Name", "dirname": "area-name"}``;
+        consumed once, so a generator can stream areas in.
         Each area can optionally include ``"topics"`` — a list of
         ``{"name": ..., "filename": ..., "depth": ...}`` dicts.
         When topics are present, they appear in a table under the area.
         When absent, only the overview link is shown.
     """
-    sections: list[str] = []
-
-    sections.append("# Knowledge Base")
-    sections.append("")
-    sections.append(f"> Domain knowledge for **{role_name}**.")
-
-    if not domain_areas:
-        sections.append("")
-        sections.append("<!-- No domain areas yet. Use init --role to create them. -->")
-        return "\n".join(sections) + "\n"
+    sections: list[str] = [
+        "# Knowledge Base",
+        "",
+        f"> Domain knowledge for **{role_name}**.",
+    ]
 
+    has_areas = False
     for area in domain_areas:
+        has_areas = True
         sections.append("")
         sections.append(f"## {area['name']}")
         sections.append("")
 
         topics = area.get("topics", [])
         if topics:
-            sections.append("| Topic | Depth |")
-            sections.append("|-------|-------|")
+            sections.append(_DEPTH_TABLE_HEADER)
             # Overview row first
             sections.append(
                 f"| [Overview]({area['dirname']}/overview.md) | overview |"
@@ -182,10 +237,20 @@ def render_index_md(role_name: str, domain_areas: list[dict]) -> str:
                 f"| [Overview]({area['dirname']}/overview.md) |"
             )
 
+    if not has_areas:
+        sections.append("")
+        sections.append("<!-- No domain areas yet. Use init --role to create them. -->")
+
     return "\n".join(sections) + "\n"
 
 
-def render_overview_md(area_name: str, relevance: str, topics: list[dict]) -> str:
+def render_overview_md(
+    area_name: str,
+    relevance: str,
+    topics: list[dict],
+    *,
+    today: str | None = None,
+) -> str:
     """Render overview.md for a single domain area.
 
     Parameters
@@ -196,107 +261,86 @@ def render_overview_md(area_name: str, relevance: str, topics: list[dict]) -> st
         One of core / supporting / peripheral.
     topics:
         List of ``{"name": ..., "filename": ..., "description": ...}``.
+    today:
+        ISO date for ``last_validated`` (default: today).
     """
-    fm = _frontmatter({
-        "sources": [
-            "url: <!-- Add primary source URL -->\n    title: <!-- Add source title -->",
-        ],
-        "last_validated": _today(),
-        "relevance": f'"{relevance}"',
-        "depth": "overview",
-    })
-
-    body_lines: list[str] = []
-
-    body_lines.append(f"# {area_name}")
-    body_lines.append("")
-    body_lines.append("## What This Covers")
-    body_lines.append("<!-- placeholder -->")
-    body_lines.append("")
-    body_lines.append("## How It's Organized")
+    fm = _topic_frontmatter(relevance, "overview", today=today)
 
     if topics:
-        body_lines.append("")
-        body_lines.append("| Topic | Description |")
-        body_lines.append("|-------|-------------|")
-        for topic in topics:
-            body_lines.append(f"| [{topic['name']}]({topic['filename']}) | {topic['description']} |")
+        organized = f"\n{_TOPIC_TABLE_HEADER}\n" + "\n".join(
+            f"| [{topic['name']}]({topic['filename']}) | {topic['description']} |"
+            for topic in topics
+        )
     else:
-        body_lines.append("<!-- No topics yet. Use the create-topic skill to add one. -->")
-
-    body_lines.append("")
-    body_lines.append("## Key Sources")
-    body_lines.append("<!-- placeholder -->")
-
-    return fm + "\n\n" + "\n".join(body_lines) + "\n"
-
-
-def render_topic_md(topic_name: str, relevance: str) -> str:
+        organized = "<!-- No topics yet. Use the create-topic skill to add one. -->"
+
+    return (
+        f"{fm}\n\n"
+        f"# {area_name}\n"
+        "\n"
+        "## What This Covers\n"
+        "<!-- placeholder -->\n"
+        "\n"
+        "## How It's Organized\n"
+        f"{organized}\n"
+        "\n"
+        "## Key Sources\n"
+        "<!-- placeholder -->\n"
+    )
+
+
+def render_topic_md(topic_name: str, relevance: str, *, today: str | None = None) -> str:
     """Render a working-knowledge topic file (<topic>.md).
 
     Includes YAML frontmatter and the five required sections.
+    *today* overrides the ``last_validated`` date.
     """
     slug = _slugify(topic_name)
-    fm = _frontmatter({
-        "sources": [
-            "url: <!-- Add primary source URL -->\n    title: <!-- Add source title -->",
-        ],
-        "last_validated": _today(),
-        "relevance": f'"{relevance}"',
-        "depth": "working",
-    })
-
-    body_lines = [
-        f"# {topic_name}",
-        "",
-        "## Why This Matters",
-        "<!-- Explain why this topic is important in your domain -->",
-        "",
-        "## In Practice",
-        "<!-- Describe how this topic is applied day-to-day -->",
-        "",
-        "## Key Guidance",
-        "<!-- Actionable recommendations and best practices -->",
-        "",
-        "## Watch Out For",
-        "<!-- Common pitfalls, anti-patterns, and mistakes -->",
-        "",
-        "## Go Deeper",
-        "",
-        f"- [{topic_name} Reference]({slug}.ref.md) -- quick-lookup version",
-        "- [Source Title](url) -- primary source for full treatment",
-        "",
-        "## Source Evaluation",
-        "<!-- Complete during research step: source scoring table and provenance block -->",
-    ]
-
-    return fm + "\n\n" + "\n".join(body_lines) + "\n"
-
-
-def render_topic_ref_md(topic_name: str, relevance: str) -> str:
+    fm = _topic_frontmatter(relevance, "working", today=today)
+
+    return (
+        f"{fm}\n\n"
+        f"# {topic_name}\n"
+        "\n"
+        "## Why This Matters\n"
+        "<!-- Explain why this topic is important in your domain -->\n"
+        "\n"
+        "## In Practice\n"
+        "<!-- Describe how this topic is applied day-to-day -->\n"
+        "\n"
+        "## Key Guidance\n"
+        "<!-- Actionable recommendations and best practices -->\n"
+        "\n"
+        "## Watch Out For\n"
+        "<!-- Common pitfalls, anti-patterns, and mistakes -->\n"
+        "\n"
+        "## Go Deeper\n"
+        "\n"
+        f"- [{topic_name} Reference]({slug}.ref.md) -- quick-lookup version\n"
+        "- [Source Title](url) -- primary source for full treatment\n"
+        "\n"
+        "## Source Evaluation\n"
+        "<!-- Complete during research step: source scoring table and provenance block -->\n"
+    )
+
+
+def render_topic_ref_md(topic_name: str, relevance: str, *, today: str | None = None) -> str:
     """Render an expert-reference topic file (<topic>.ref.md).
 
     Terse and scannable. Intended for quick look-ups by experienced users.
+    *today* overrides the ``last_validated`` date.
     """
     slug = _slugify(topic_name)
-    fm = _frontmatter({
-        "sources": [
-            "url: <!-- Add primary source URL -->\n    title: <!-- Add source title -->",
-        ],
-        "last_validated": _today(),
-        "relevance": f'"{relevance}"',
-        "depth": "reference",
-    })
-
-    body_lines = [
-        f"# {topic_name}",
-        "",
-        "<!-- Quick-reference notes: keep terse and scannable -->",
-        "",
-        f"**See also:** [{topic_name}]({slug}.md)",
-    ]
+    fm = _topic_frontmatter(relevance, "reference", today=today)
 
-    return fm + "\n\n" + "\n".join(body_lines) + "\n"
+    return (
+        f"{fm}\n\n"
+        f"# {topic_name}\n"
+        "\n"
+        "<!-- Quick-reference notes: keep terse and scannable -->\n"
+        "\n"
+        f"**See also:** [{topic_name}]({slug}.md)\n"
+    )
 
 
 def render_claude_md_section(role_name: str, domain_areas: list[dict], *, knowledge_dir: str = "docs") -> str:
@@ -314,68 +358,81 @@ def render_claude_md_section(role_name: str, domain_areas: list[dict], *, knowle
     knowledge_dir:
         Name of the knowledge directory (default: "docs").
     """
-    lines: list[str] = []
-
-    lines.append("## Knowledge Base")
-    lines.append("")
-    lines.append("This project contains a curated knowledge base with progressive disclosure:")
-    lines.append("overviews for orientation, working-knowledge files for daily use, and")
-    lines.append("`.ref.md` reference companions for quick lookups.")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+
+    w(
+        "## Knowledge Base\n"
+        "\n"
+        "This project contains a curated knowledge base with progressive disclosure:\n"
+        "overviews for orientation, working-knowledge files for daily use, and\n"
+        "`.ref.md` reference companions for quick lookups.\n"
+        "\n"
+    )
 
     # How to Use This Knowledge Base
-    lines.append("### How to Use This Knowledge Base")
-    lines.append("")
-    lines.append("1. Read `AGENTS.md` for the full role definition and topic manifest")
-    lines.append(f"2. Load topic files from `{knowledge_dir}/` when the task relates to a domain area")
-    lines.append("3. Cite primary sources from the `sources` frontmatter when making recommendations")
-    lines.append("4. Use `.ref.md` files for quick lookups without loading full topic context")
-    lines.append("5. Check `.dewey/curation-plan.md` for planned topics and curation priorities")
-    lines.append("6. When a conversation touches knowledge areas not covered by existing topics or the plan,")
-    lines.append("   mention this to the user and suggest adding them to the curation plan")
-    lines.append("")
+    w(
+        "### How to Use This Knowledge Base\n"
+        "\n"
+        "1. Read `AGENTS.md` for the full role definition and topic manifest\n"
+        f"2. Load topic files from `{knowledge_dir}/` when the task relates to a domain area\n"
+        "3. Cite primary sources from the `sources` frontmatter when making recommendations\n"
+        "4. Use `.ref.md` files for quick lookups without loading full topic context\n"
+        "5. Check `.dewey/curation-plan.md` for planned topics and curation priorities\n"
+        "6. When a conversation touches knowledge areas not covered by existing topics or the plan,\n"
+        "   mention this to the user and suggest adding them to the curation plan\n"
+        "\n"
+    )
 
     # Directory Structure
-    lines.append("### Directory Structure")
-    lines.append("")
-    lines.append("```")
-    lines.append("AGENTS.md              # Role persona and topic manifest")
-    lines.append(f"{knowledge_dir}/")
-    lines.append("  index.md             # Table of contents")
+    w(
+        "### Directory Structure\n"
+        "\n"
+        "```\n"
+        "AGENTS.md              # Role persona and topic manifest\n"
+        f"{knowledge_dir}/\n"
+        "  index.md             # Table of contents\n"
+    )
     for area in domain_areas:
-        lines.append(f"  {area['dirname']}/")
-        lines.append(f"    overview.md        # {area['name']} overview")
-    lines.append("  _proposals/            # Pending topic proposals")
-    lines.append("```")
-    lines.append("")
+        w(f"  {area['dirname']}/\n    overview.md        # {area['name']} overview\n")
+    w(
+        "  _proposals/            # Pending topic proposals\n"
+        "```\n"
+        "\n"
+    )
 
     # Frontmatter Reference
-    lines.append("### Frontmatter Reference")
-    lines.append("")
-    lines.append("Every topic file includes YAML frontmatter with these fields:")
-    lines.append("")
-    lines.append("| Field | Purpose |")
-    lines.append("|-------|---------|")
-    lines.append("| `sources` | Primary source URLs and titles for citation |")
-    lines.append("| `last_validated` | Date the content was last verified against sources |")
-    lines.append("| `relevance` | `core` / `supporting` / `peripheral` -- importance to the role |")
-    lines.append("| `depth` | `overview` / `working` / `reference` -- level of detail |")
-    lines.append("")
+    w(
+        "### Frontmatter Reference\n"
+        "\n"
+        "Every topic file includes YAML frontmatter with these fields:\n"
+        "\n"
+        "| Field | Purpose |\n"
+        "|-------|---------|\n"
+        "| `sources` | Primary source URLs and titles for citation |\n"
+        "| `last_validated` | Date the content was last verified against sources |\n"
+        "| `relevance` | `core` / `supporting` / `peripheral` -- importance to the role |\n"
+        "| `depth` | `overview` / `working` / `reference` -- level of detail |\n"
+        "\n"
+    )
 
     # Domain Areas
     if domain_areas:
-        lines.append("### Domain Areas")
-        lines.append("")
-        lines.append("| Area | Path | Overview |")
-        lines.append("|------|------|----------|")
+        w(
+            "### Domain Areas\n"
+            "\n"
+            "| Area | Path | Overview |\n"
+            "|------|------|----------|\n"
+        )
         for area in domain_areas:
-            lines.append(
+            w(
                 f"| {area['name']} "
                 f"| `{knowledge_dir}/{area['dirname']}/` "
-                f"| [overview.md]({knowledge_dir}/{area['dirname']}/overview.md) |"
+                f"| [overview.md]({knowledge_dir}/{area['dirname']}/overview.md) |\n"
             )
 
-    return "\n".join(lines)
+    # Every write ends in a newline; drop the last one to match a line join
+    return buf.getvalue()[:-1]
 
 
 def render_claude_md(role_name: str, domain_areas: list[dict], *, knowledge_dir: str = "docs") -> str:
@@ -393,13 +450,8 @@ def render_claude_md(role_name: str, domain_areas: list[dict], *, knowledge_dir:
     knowledge_dir:
         Name of the knowledge directory (default: "docs").
     """
-    lines: list[str] = []
-
-    lines.append(MARKER_BEGIN)
-    lines.append(render_claude_md_section(role_name, domain_areas, knowledge_dir=knowledge_dir))
-    lines.append(MARKER_END)
-
-    return "\n".join(lines) + "\n"
+    managed = render_claude_md_section(role_name, domain_areas, knowledge_dir=knowledge_dir)
+    return f"{MARKER_BEGIN}\n{managed}\n{MARKER_END}\n"
 
 
 # ------------------------------------------------------------------
@@ -438,49 +490,48 @@ def render_proposal_md(
     relevance: str,
     proposed_by: str,
     rationale: str,
+    *,
+    today: str | None = None,
 ) -> str:
     """Render a proposal file for a new or revised topic.
 
     Extends the working-knowledge template with proposal-specific frontmatter.
+    *today* overrides the ``last_validated`` date.
     """
-    fm = _frontmatter({
-        "sources": [
-            "url: <!-- Add primary source URL -->\n    title: <!-- Add source title -->",
-        ],
-        "last_validated": _today(),
-        "relevance": f'"{relevance}"',
-        "depth": "working",
-        "status": "proposal",
-        "proposed_by": proposed_by,
-        "rationale": rationale,
-    })
-
-    body_lines = [
-        f"# {topic_name}",
-        "",
-        "## Why This Matters",
-        "<!-- Explain why this topic is important in your domain -->",
-        "",
-        "## In Practice",
-        "<!-- Describe how this topic is applied day-to-day -->",
-        "",
-        "## Key Guidance",
-        "<!-- Actionable recommendations and best practices -->",
-        "",
-        "## Watch Out For",
-        "<!-- Common pitfalls, anti-patterns, and mistakes -->",
-        "",
-        "## Go Deeper",
-        "<!-- Links to primary sources, books, talks, and further reading -->",
-        "",
-        "## Source Evaluation",
-        "<!-- Complete during research step: source scoring table and provenance block -->",
-    ]
-
-    return fm + "\n\n" + "\n".join(body_lines) + "\n"
-
-
-def render_curation_plan_md(domain_areas: list[dict]) -> str:
+    fm = _topic_frontmatter(
+        relevance,
+        "working",
+        today=today,
+        status="proposal",
+        proposed_by=proposed_by,
+        rationale=rationale,
+    )
+
+    return (
+        f"{fm}\n\n"
+        f"# {topic_name}\n"
+        "\n"
+        "## Why This Matters\n"
+        "<!-- Explain why this topic is important in your domain -->\n"
+        "\n"
+        "## In Practice\n"
+        "<!-- Describe how this topic is applied day-to-day -->\n"
+        "\n"
+        "## Key Guidance\n"
+        "<!-- Actionable recommendations and best practices -->\n"
+        "\n"
+        "## Watch Out For\n"
+        "<!-- Common pitfalls, anti-patterns, and mistakes -->\n"
+        "\n"
+        "## Go Deeper\n"
+        "<!-- Links to primary sources, books, talks, and further reading -->\n"
+        "\n"
+        "## Source Evaluation\n"
+        "<!-- Complete during research step: source scoring table and provenance block -->\n"
+    )
+
+
+def render_curation_plan_md(domain_areas: list[dict], *, today: str | None = None) -> str:
     """Render a persistent curation plan file (.dewey/curation-plan.md).
 
     Parameters
@@ -491,10 +542,12 @@ def render_curation_plan_md(domain_areas: list[dict]) -> str:
         "rationale": "brief reason"}]}``.
         Items in ``starter_topics`` can also be plain strings, in which
         case relevance defaults to ``"core"`` and rationale is empty.
+    today:
+        ISO date for ``last_updated`` (default: today).
 
     Returns a complete markdown file with frontmatter and checkbox items.
     """
-    fm = _frontmatter({"last_updated": _today()})
+    fm = _frontmatter({"last_updated": today or _today()})
 
     body: list[str] = [
         "# Curation Plan",
@@ -540,7 +593,7 @@ def render_curate_plan(domain_areas: list[dict]) -> str:
 
     Returns an empty string if no areas have starter topics.
     """
-    lines: list[str] = []
+    area_blocks: list[str] = []
     counter = 0
 
     for area in domain_areas:
@@ -548,17 +601,16 @@ def render_curate_plan(domain_areas: list[dict]) -> str:
         if not topics:
             continue
         slug = area.get("slug") or _slugify(area["name"])
-        lines.append(f"### {area['name']}")
+        block = [f"### {area['name']}"]
         for topic in topics:
             counter += 1
-            lines.append(f"{counter}. `/dewey:curate add {topic} in {slug}`")
-        lines.append("")
+            block.append(f"{counter}. `/dewey:curate add {topic} in {slug}`")
+        area_blocks.append("\n".join(block))
 
-    if not lines:
+    if not area_blocks:
         return ""
 
-    header = ["## Next Steps: Populate Your Knowledge Base", ""]
-    return "\n".join(header + lines).rstrip("\n") + "\n"
+    return "## Next Steps: Populate Your Knowledge Base\n\n" + "\n\n".join(area_blocks) + "\n"
 
 
 def render_hooks_json(plugin_root: str, knowledge_base_root: str) -> str:
@@ -21,6 +21,11 @@ _scripts_dir = str(Path(__file__).resolve().parent)
 if _scripts_dir not in sys.path:
     sys.path.insert(0, _scripts_dir)
 
+# templates.py lives in curate/scripts/ — add it to sys.path for cross-skill import.
+_curate_scripts = str(Path(__file__).resolve().parent.parent.parent / "curate" / "scripts")
+if _curate_scripts not in sys.path:
+    sys.path.insert(0, _curate_scripts)
+
 from validators import (
     _OVERVIEW_SECTIONS,
     _WORKING_SECTIONS,
@@ -29,6 +34,9 @@ from validators import (
     parse_frontmatter,
 )
 
+from cross_validators import _parse_curation_plan
+from templates import _slugify
+
 
 def fix_missing_sections(file_path: Path, issues: list[dict]) -> list[dict]:
     """Insert stub headings for missing required sections.
@@ -231,9 +239,6 @@ def fix_curation_plan_checkmarks(knowledge_base_root: Path, *, knowledge_dir_nam
 
     Returns a list of action dicts describing what was changed.
     """
-    from cross_validators import _parse_curation_plan
-    from templates import _slugify
-
     plan_path = knowledge_base_root / ".dewey" / "curation-plan.md"
     if not plan_path.exists():
         return []
@@ -10,8 +10,9 @@ Only stdlib is used.
 from __future__ import annotations
 
 import json
+import os
 import sys
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
 # config.py lives in curate/scripts/ — add it to sys.path for cross-skill import.
@@ -61,6 +62,7 @@ from validators import (
     check_source_accessibility,
     check_source_diversity,
     check_source_urls,
+    collect_existing_paths,
     parse_frontmatter,
 )
 
@@ -72,23 +74,61 @@ def _discover_md_files(knowledge_base_root: Path, knowledge_dir_name: str = "doc
         return []
 
     md_files: list[Path] = []
-    for md_file in sorted(knowledge_dir.rglob("*.md")):
-        # Skip files inside directories that start with _
-        parts = md_file.relative_to(knowledge_dir).parts
-        if any(part.startswith("_") for part in parts):
-            continue
-        # Skip structural files (not knowledge topics)
-        if md_file.name == "index.md":
-            continue
-        md_files.append(md_file)
+    # os.walk hands back plain names, so directories starting with _ are
+    # pruned before they are listed and no Path is built for non-.md files
+    for root, dirs, files in os.walk(knowledge_dir):
+        dirs[:] = [d for d in dirs if not d.startswith("_")]
+        for name in files:
+            if not name.endswith(".md") or name.startswith("_"):
+                continue
+            # Skip structural files (not knowledge topics)
+            if name == "index.md":
+                continue
+            md_files.append(Path(root, name))
 
+    md_files.sort()
     return md_files
 
 
+def _run_tier1_validators(
+    md_file: Path,
+    knowledge_base_root: Path,
+    existing_paths: set[str],
+    today: date,
+    check_links: bool,
+) -> list[dict]:
+    """Run every per-file Tier 1 validator on *md_file*, in report order.
+
+    The file is read once and its text handed to each validator.
+    """
+    text = md_file.read_text()
+    issues: list[dict] = []
+    issues.extend(check_frontmatter(md_file, text=text))
+    issues.extend(check_section_ordering(md_file, text=text))
+    issues.extend(check_cross_references(
+        md_file, knowledge_base_root, existing_paths=existing_paths, text=text,
+    ))
+    issues.extend(check_size_bounds(md_file, text=text))
+    issues.extend(check_source_urls(md_file, text=text))
+    issues.extend(check_freshness(md_file, today=today, text=text))
+    issues.extend(check_section_completeness(md_file, text=text))
+    issues.extend(check_heading_hierarchy(md_file, text=text))
+    issues.extend(check_go_deeper_links(md_file, text=text))
+    issues.extend(check_ref_see_also(md_file, text=text))
+    issues.extend(check_readability(md_file, text=text))
+    issues.extend(check_placeholder_comments(md_file, text=text))
+    issues.extend(check_source_diversity(md_file, text=text))
+    issues.extend(check_citation_grounding(md_file, text=text))
+    if check_links:
+        issues.extend(check_source_accessibility(md_file, text=text))
+    return issues
+
+
 def run_health_check(
     knowledge_base_root: Path,
     *,
     _persist_history: bool = True,
+    _md_files: list[Path] | None = None,
     fix: bool = False,
     dry_run: bool = False,
     check_links: bool = False,
@@ -103,6 +143,9 @@ def run_health_check(
         When *True* (default), automatically persist a history snapshot.
         Set to *False* when called from ``run_combined_report`` to avoid
         duplicate entries.
+    _md_files:
+        Pre-discovered knowledge files, passed by ``run_combined_report``
+        so the tree is walked once.  Discovered here when *None*.
     fix:
         When *True*, apply conservative auto-fixes for fixable issues.
     dry_run:
@@ -116,30 +159,23 @@ def run_health_check(
     """
     knowledge_dir_name = read_knowledge_dir(knowledge_base_root)
     all_issues: list[dict] = []
-    md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
+    md_files = _md_files
+    if md_files is None:
+        md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
 
     # Compute relative paths for history tracking
     knowledge_dir = knowledge_base_root / knowledge_dir_name
     file_list = [str(f.relative_to(knowledge_dir)) for f in md_files]
 
+    # Index the knowledge directory once so link checks are set lookups
+    existing_paths = collect_existing_paths(knowledge_dir) if md_files else set()
+    today = date.today()
+
     # Per-file validators
     for md_file in md_files:
-        all_issues.extend(check_frontmatter(md_file))
-        all_issues.extend(check_section_ordering(md_file))
-        all_issues.extend(check_cross_references(md_file, knowledge_base_root))
-        all_issues.extend(check_size_bounds(md_file))
-        all_issues.extend(check_source_urls(md_file))
-        all_issues.extend(check_freshness(md_file))
-        all_issues.extend(check_section_completeness(md_file))
-        all_issues.extend(check_heading_hierarchy(md_file))
-        all_issues.extend(check_go_deeper_links(md_file))
-        all_issues.extend(check_ref_see_also(md_file))
-        all_issues.extend(check_readability(md_file))
-        all_issues.extend(check_placeholder_comments(md_file))
-        all_issues.extend(check_source_diversity(md_file))
-        all_issues.extend(check_citation_grounding(md_file))
-        if check_links:
-            all_issues.extend(check_source_accessibility(md_file))
+        all_issues.extend(_run_tier1_validators(
+            md_file, knowledge_base_root, existing_paths, today, check_links,
+        ))
 
     # Structural validators (run once)
     all_issues.extend(check_coverage(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
@@ -150,25 +186,25 @@ def run_health_check(
     all_issues.extend(check_manifest_sync(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
     all_issues.extend(check_curation_plan_sync(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
     all_issues.extend(check_proposal_integrity(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
-    all_issues.extend(check_link_graph(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
+    all_issues.extend(check_link_graph(
+        knowledge_base_root, knowledge_dir_name=knowledge_dir_name, md_files=md_files,
+    ))
     all_issues.extend(check_duplicate_content(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
     all_issues.extend(check_naming_conventions(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
 
     # Build summary
+    # Single pass over the issues for both counts and the failing-file set
     files_with_fails = set()
-    files_with_warns = set()
-    all_mentioned_files = set()
+    fail_count = 0
+    warn_count = 0
 
     for issue in all_issues:
-        f = issue.get("file", "")
-        all_mentioned_files.add(f)
-        if issue["severity"] == "fail":
-            files_with_fails.add(f)
-        elif issue["severity"] == "warn":
-            files_with_warns.add(f)
-
-    fail_count = sum(1 for i in all_issues if i["severity"] == "fail")
-    warn_count = sum(1 for i in all_issues if i["severity"] == "warn")
+        severity = issue["severity"]
+        if severity == "fail":
+            fail_count += 1
+            files_with_fails.add(issue.get("file", ""))
+        elif severity == "warn":
+            warn_count += 1
 
     result = {
         "issues": all_issues,
@@ -247,7 +283,12 @@ _TIER2_TRIGGERS = [
 ]
 
 
-def run_tier2_prescreening(knowledge_base_root: Path, *, _persist_history: bool = True) -> dict:
+def run_tier2_prescreening(
+    knowledge_base_root: Path,
+    *,
+    _persist_history: bool = True,
+    _md_files: list[Path] | None = None,
+) -> dict:
     """Run all Tier 2 deterministic triggers and return a structured queue.
 
     Parameters
@@ -258,6 +299,9 @@ def run_tier2_prescreening(knowledge_base_root: Path, *, _persist_history: bool
         When *True* (default), automatically persist a history snapshot.
         Set to *False* when called from ``run_combined_report`` to avoid
         duplicate entries.
+    _md_files:
+        Pre-discovered knowledge files, passed by ``run_combined_report``
+        so the tree is walked once.  Discovered here when *None*.
 
     Returns
     -------
@@ -265,13 +309,13 @@ def run_tier2_prescreening(knowledge_base_root: Path, *, _persist_history: bool
         ``{"queue": [...], "summary": {...}}``
     """
     knowledge_dir_name = read_knowledge_dir(knowledge_base_root)
-    md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
-
-    knowledge_dir = knowledge_base_root / knowledge_dir_name
-    file_list = [str(f.relative_to(knowledge_dir)) for f in md_files]
+    md_files = _md_files
+    if md_files is None:
+        md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
 
     queue: list[dict] = []
     trigger_counts: dict[str, int] = {}
+    triggered_files: set[str] = set()
 
     for md_file in md_files:
         for trigger_fn in _TIER2_TRIGGERS:
@@ -279,8 +323,9 @@ def run_tier2_prescreening(knowledge_base_root: Path, *, _persist_history: bool
                 queue.append(item)
                 t = item["trigger"]
                 trigger_counts[t] = trigger_counts.get(t, 0) + 1
+                triggered_files.add(item["file"])
 
-    files_with_triggers = len({item["file"] for item in queue})
+    files_with_triggers = len(triggered_files)
 
     result = {
         "queue": queue,
@@ -291,6 +336,10 @@ def run_tier2_prescreening(knowledge_base_root: Path, *, _persist_history: bool
         },
     }
     if _persist_history:
+        # The relative file list only feeds the snapshot, so it is not
+        # built when run_combined_report records history itself
+        knowledge_dir = knowledge_base_root / knowledge_dir_name
+        file_list = [str(f.relative_to(knowledge_dir)) for f in md_files]
         record_snapshot(knowledge_base_root, None, result["summary"], file_list=file_list)
     return result
 
@@ -313,9 +362,14 @@ def run_combined_report(knowledge_base_root: Path) -> dict:
     knowledge_dir = knowledge_base_root / knowledge_dir_name
     file_list = [str(f.relative_to(knowledge_dir)) for f in md_files]
 
+    # Both tiers share this discovery instead of walking the tree again
     result = {
-        "tier1": run_health_check(knowledge_base_root, _persist_history=False),
-        "tier2": run_tier2_prescreening(knowledge_base_root, _persist_history=False),
+        "tier1": run_health_check(
+            knowledge_base_root, _persist_history=False, _md_files=md_files,
+        ),
+        "tier2": run_tier2_prescreening(
+            knowledge_base_root, _persist_history=False, _md_files=md_files,
+        ),
     }
     record_snapshot(
         knowledge_base_root, result["tier1"]["summary"], result["tier2"]["summary"],
@@ -378,21 +432,16 @@ def generate_recommendations(
             ),
         }
 
-    # Check day span
-    all_timestamps = []
-    for entry in utilization.values():
-        all_timestamps.append(entry["first_referenced"])
-        all_timestamps.append(entry["last_referenced"])
-    if all_timestamps:
-        earliest = min(all_timestamps)
-        latest = max(all_timestamps)
-        try:
-            earliest_dt = datetime.fromisoformat(earliest)
-            latest_dt = datetime.fromisoformat(latest)
-            day_span = (latest_dt - earliest_dt).days
-        except ValueError:
-            day_span = 0
-    else:
+    # Check day span.  Each entry's first_referenced <= last_referenced, so
+    # the bounds come straight from those fields without pooling every
+    # timestamp into one list.
+    earliest = min(entry["first_referenced"] for entry in utilization.values())
+    latest = max(entry["last_referenced"] for entry in utilization.values())
+    try:
+        earliest_dt = datetime.fromisoformat(earliest)
+        latest_dt = datetime.fromisoformat(latest)
+        day_span = (latest_dt - earliest_dt).days
+    except ValueError:
         day_span = 0
 
     if day_span < min_days:
@@ -452,18 +501,21 @@ def generate_recommendations(
 
     # Check freshness for high-read files
     stale_files: set[str] = set()
+    today = date.today()
     for rel_path, abs_path in file_paths.items():
         if read_counts.get(rel_path, 0) > median_reads:
-            issues = check_freshness(abs_path)
+            issues = check_freshness(abs_path, today=today)
             if issues:
                 stale_files.add(rel_path)
 
     # --- Classify files ---
     recommendations: list[dict] = []
     classified: set[str] = set()
+    # Sorted once and shared by the per-file passes below
+    sorted_paths = sorted(file_paths)
 
     # Priority 1: stale_high_use
-    for rel_path in sorted(file_paths):
+    for rel_path in sorted_paths:
         if rel_path in stale_files:
             area_parts = rel_path.split("/")
             area_name = area_parts[1] if len(area_parts) >= 3 else ""
@@ -483,7 +535,7 @@ def generate_recommendations(
             classified.add(rel_path)
 
     # Priority 2: expand_depth
-    for rel_path in sorted(file_paths):
+    for rel_path in sorted_paths:
         if rel_path in classified:
             continue
         if depths.get(rel_path) != "overview":
@@ -537,7 +589,7 @@ def generate_recommendations(
                 classified.add(rel_path)
 
     # Priority 4: never_referenced
-    for rel_path in sorted(file_paths):
+    for rel_path in sorted_paths:
         if rel_path in classified:
             continue
         if read_counts.get(rel_path, 0) == 0:
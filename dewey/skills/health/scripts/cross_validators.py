@@ -12,11 +12,12 @@ Only stdlib is used.
 
 from __future__ import annotations
 
-import hashlib
+import os
 import re
 import sys
 from datetime import date
 from pathlib import Path
+from typing import Optional
 
 # ------------------------------------------------------------------
 # Cross-skill imports (templates.py lives in curate/scripts/)
@@ -33,10 +34,12 @@ if _scripts_dir not in sys.path:
     sys.path.insert(0, _scripts_dir)
 
 from validators import (
+    _MD_LINK_RE,
     _WORKING_SECTIONS,
     _body_without_frontmatter,
+    _parse_frontmatter_text,
+    _resolve_existing,
     _strip_fenced_code_blocks,
-    parse_frontmatter,
 )
 
 
@@ -44,6 +47,26 @@ from validators import (
 # Shared private helpers
 # ------------------------------------------------------------------
 
+def _scan_area_md_names(knowledge_dir: Path) -> list[tuple[str, list[str]]]:
+    """Return ``(area_name, sorted .md names)`` for each area directory.
+
+    Areas are the subdirectories of *knowledge_dir* not starting with
+    ``_`` or ``.``, in sorted order.  One ``os.scandir`` per directory
+    replaces ``iterdir()`` + ``is_dir()`` + ``glob("*.md")``, and entries
+    are filtered by name before any ``Path`` is built.
+    """
+    with os.scandir(knowledge_dir) as it:
+        area_names = sorted(
+            e.name for e in it
+            if e.is_dir() and not e.name.startswith(("_", "."))
+        )
+    areas: list[tuple[str, list[str]]] = []
+    for area_name in area_names:
+        with os.scandir(os.path.join(knowledge_dir, area_name)) as it:
+            areas.append((area_name, sorted(e.name for e in it if e.name.endswith(".md"))))
+    return areas
+
+
 def _discover_areas_and_topics(knowledge_base_root: Path, knowledge_dir_name: str = "docs") -> dict[str, list[Path]]:
     """Scan filesystem for area dirs -> topic files.
 
@@ -56,21 +79,12 @@ def _discover_areas_and_topics(knowledge_base_root: Path, knowledge_dir_name: st
         return {}
 
     areas: dict[str, list[Path]] = {}
-    for child in sorted(knowledge_dir.iterdir()):
-        if not child.is_dir():
-            continue
-        if child.name.startswith("_") or child.name.startswith("."):
-            continue
-        topics: list[Path] = []
-        for md_file in sorted(child.glob("*.md")):
-            if md_file.name == "overview.md":
-                continue
-            if md_file.name.endswith(".ref.md"):
-                continue
-            if md_file.name == "index.md":
-                continue
-            topics.append(md_file)
-        areas[child.name] = topics
+    for area_name, md_names in _scan_area_md_names(knowledge_dir):
+        child = knowledge_dir / area_name
+        areas[area_name] = [
+            child / fname for fname in md_names
+            if fname not in ("overview.md", "index.md") and not fname.endswith(".ref.md")
+        ]
     return areas
 
 
@@ -87,6 +101,13 @@ def _managed_section(text: str) -> str | None:
 # AGENTS.md parser
 # ------------------------------------------------------------------
 
+# Per line: a "### Area" heading, or a table row's first [name](path) link
+_AGENTS_LINE_RE = re.compile(
+    r"^###[^\S\n]+(.+)$|^\|[^\n]*?\[([^\]\n]+)\]\(([^)\n]+)\)",
+    re.MULTILINE,
+)
+
+
 def _parse_agents_managed(text: str) -> dict[str, list[dict]]:
     """Extract area headings and topic table rows from AGENTS.md managed section.
 
@@ -99,22 +120,16 @@ def _parse_agents_managed(text: str) -> dict[str, list[dict]]:
     areas: dict[str, list[dict]] = {}
     current_area: str | None = None
 
-    for line in section.split("\n"):
+    # One finditer over the section instead of a regex call per line
+    for match in _AGENTS_LINE_RE.finditer(section):
+        heading, name, path = match.groups()
         # ### Area Name
-        heading_match = re.match(r"^###\s+(.+)$", line)
-        if heading_match:
-            current_area = heading_match.group(1).strip()
+        if heading is not None:
+            current_area = heading.strip()
             areas[current_area] = []
-            continue
-
         # | [Topic Name](path) | description |
-        if current_area is not None and line.startswith("|"):
-            link_match = re.search(r"\[([^\]]+)\]\(([^)]+)\)", line)
-            if link_match:
-                areas[current_area].append({
-                    "name": link_match.group(1),
-                    "path": link_match.group(2),
-                })
+        elif current_area is not None:
+            areas[current_area].append({"name": name, "path": path})
 
     return areas
 
@@ -167,7 +182,7 @@ def _parse_domain_areas_table(text: str) -> list[dict]:
 
         name = cells[0]
         path = cells[1].strip("`")
-        overview_match = re.search(r"\[([^\]]*)\]\(([^)]+)\)", cells[2])
+        overview_match = _MD_LINK_RE.search(cells[2])
         overview = overview_match.group(2) if overview_match else ""
         entries.append({"name": name, "path": path, "overview": overview})
 
@@ -362,7 +377,14 @@ def check_curation_plan_sync(knowledge_base_root: Path, *, knowledge_dir_name: s
         rel = f"{area}/{slug}.md"
         plan_topics.add(rel)
 
-        file_exists = (knowledge_dir / area / f"{slug}.md").exists()
+        if rel in disk_files:
+            file_exists = True
+        elif area in areas_on_disk and slug not in ("overview", "index"):
+            # The area was already listed and this name is not one the
+            # discovery filters out, so a miss needs no extra stat()
+            file_exists = False
+        else:
+            file_exists = (knowledge_dir / rel).exists()
 
         if item["checked"] and not file_exists:
             issues.append({
@@ -408,9 +430,12 @@ def check_proposal_integrity(
     if not proposal_files:
         return issues
 
+    today = date.today()
     for pf in proposal_files:
         name = str(pf)
-        fm = parse_frontmatter(pf)
+        # One read serves both the frontmatter and the section checks
+        text = pf.read_text()
+        fm = _parse_frontmatter_text(text)
 
         if fm.get("status") != "proposal":
             issues.append({
@@ -438,7 +463,7 @@ def check_proposal_integrity(
         if last_validated:
             try:
                 validated_date = date.fromisoformat(str(last_validated))
-                age = (date.today() - validated_date).days
+                age = (today - validated_date).days
                 if age > max_age_days:
                     issues.append({
                         "file": name,
@@ -449,13 +474,12 @@ def check_proposal_integrity(
                 pass
 
         # Check for required working sections
-        text = pf.read_text()
         body = _body_without_frontmatter(text)
-        headings = re.findall(r"^##\s+(.+)$", body, re.MULTILINE)
-        heading_lower = [h.lower() for h in headings]
+        # One substring search over the joined headings per section
+        headings = "\n".join(re.findall(r"^##\s+(.+)$", body, re.MULTILINE)).lower()
 
         for section in _WORKING_SECTIONS:
-            if not any(section.lower() in h for h in heading_lower):
+            if section.lower() not in headings:
                 issues.append({
                     "file": name,
                     "message": f"Proposal missing required section: {section}",
@@ -465,8 +489,72 @@ def check_proposal_integrity(
     return issues
 
 
-def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "docs") -> list[dict]:
-    """Check for orphaned files and overview completeness."""
+def _resolved_link_targets(
+    md_file: Path,
+    resolve_cache: dict[tuple[str, str], Optional[str]],
+    file_keys: dict[str, str],
+) -> list[str]:
+    """Return the resolved paths of existing files that *md_file* links to.
+
+    *file_keys* maps the normalized absolute path of every checked file to
+    its resolved path; a link that normalizes onto one of them is a dict
+    lookup.  Other targets go through *resolve_cache*, which maps
+    ``(parent dir, link target)`` to the resolved path (or None when it
+    does not exist).  Both are shared by every file in one
+    ``check_link_graph`` run, so a target linked from several files in the
+    same directory costs at most one path resolution.
+    """
+    targets: list[str] = []
+    parent = md_file.parent
+    parent_key = str(parent)
+    text = md_file.read_text()
+    # Files without any "](" cannot hold a link; skip the regex scan
+    if "](" not in text:
+        return targets
+    parent_abs = os.path.abspath(parent)
+    links = _MD_LINK_RE.findall(text)
+    for _link_text, target in links:
+        target = target.strip()
+        if target.startswith(("http://", "https://", "#", "mailto:")):
+            continue
+        target_path = target.split("#")[0]
+        if not target_path:
+            continue
+        known = file_keys.get(os.path.normpath(os.path.join(parent_abs, target_path)))
+        if known is not None:
+            targets.append(known)
+            continue
+        key = (parent_key, target_path)
+        if key in resolve_cache:
+            resolved_key = resolve_cache[key]
+        else:
+            resolved = _resolve_existing(parent / target_path)
+            resolved_key = str(resolved) if resolved is not None else None
+            resolve_cache[key] = resolved_key
+        if resolved_key is not None:
+            targets.append(resolved_key)
+    return targets
+
+
+def check_link_graph(
+    knowledge_base_root: Path,
+    *,
+    knowledge_dir_name: str = "docs",
+    md_files: Optional[list[Path]] = None,
+) -> list[dict]:
+    """Check for orphaned files and overview completeness.
+
+    Parameters
+    ----------
+    knowledge_base_root:
+        Root directory of the knowledge base.
+    knowledge_dir_name:
+        Name of the knowledge directory under *knowledge_base_root*.
+    md_files:
+        Optional sorted list of knowledge files (excluding ``_``-prefixed
+        paths and ``index.md``) already discovered by the caller, so the
+        tree is not walked a second time.  Discovered here when *None*.
+    """
     issues: list[dict] = []
     knowledge_dir = knowledge_base_root / knowledge_dir_name
 
@@ -474,14 +562,21 @@ def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
         return issues
 
     # Collect all .md files (excluding _proposals, index.md)
-    all_files: list[Path] = []
-    for md_file in sorted(knowledge_dir.rglob("*.md")):
-        parts = md_file.relative_to(knowledge_dir).parts
-        if any(part.startswith("_") for part in parts):
-            continue
-        if md_file.name == "index.md":
-            continue
-        all_files.append(md_file)
+    if md_files is not None:
+        all_files = md_files
+    else:
+        all_files = []
+        # Prune _-prefixed directories before descending instead of
+        # walking them with rglob and filtering afterwards
+        for root, dirs, files in os.walk(knowledge_dir):
+            dirs[:] = [d for d in dirs if not d.startswith("_")]
+            for name in files:
+                if not name.endswith(".md") or name.startswith("_"):
+                    continue
+                if name == "index.md":
+                    continue
+                all_files.append(Path(root, name))
+        all_files.sort()
 
     if not all_files:
         return issues
@@ -491,28 +586,21 @@ def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
 
     # Build directed link graph: file -> set of files it links to
     linked_from: dict[str, set[str]] = {}  # target -> set of sources
+    resolve_cache: dict[tuple[str, str], Optional[str]] = {}
+    # Each checked file is resolved once up front; links onto these files
+    # (nearly all of them) then need no filesystem calls
+    file_keys = {os.path.abspath(f): str(f.resolve()) for f in all_files}
     for md_file in all_files:
-        text = md_file.read_text()
-        links = re.findall(r"\[([^\]]*)\]\(([^)]+)\)", text)
-        for _link_text, target in links:
-            target = target.strip()
-            if target.startswith(("http://", "https://", "#", "mailto:")):
-                continue
-            target_path = target.split("#")[0]
-            if not target_path:
-                continue
-            resolved = (md_file.parent / target_path).resolve()
-            if resolved.exists():
-                resolved_key = str(resolved)
-                if resolved_key not in linked_from:
-                    linked_from[resolved_key] = set()
-                linked_from[resolved_key].add(str(md_file))
+        for resolved_key in _resolved_link_targets(md_file, resolve_cache, file_keys):
+            if resolved_key not in linked_from:
+                linked_from[resolved_key] = set()
+            linked_from[resolved_key].add(str(md_file))
 
     # Orphan detection
     for md_file in all_files:
         if md_file.name in entry_names:
             continue
-        file_key = str(md_file.resolve())
+        file_key = file_keys[os.path.abspath(md_file)]
         if file_key not in linked_from:
             rel = str(md_file.relative_to(knowledge_dir))
             issues.append({
@@ -523,26 +611,16 @@ def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
 
     # Overview completeness: each overview.md's "How It's Organized" should
     # link to all topic files in that area directory
-    for area_dir in sorted(knowledge_dir.iterdir()):
-        if not area_dir.is_dir():
-            continue
-        if area_dir.name.startswith("_") or area_dir.name.startswith("."):
-            continue
-
-        overview = area_dir / "overview.md"
-        if not overview.exists():
+    for area_name, md_names in _scan_area_md_names(knowledge_dir):
+        if "overview.md" not in md_names:
             continue
+        overview = knowledge_dir / area_name / "overview.md"
 
         # Get topic files in this area (not overview, not .ref.md)
-        topic_files = set()
-        for md_file in sorted(area_dir.glob("*.md")):
-            if md_file.name == "overview.md":
-                continue
-            if md_file.name.endswith(".ref.md"):
-                continue
-            if md_file.name == "index.md":
-                continue
-            topic_files.add(md_file.name)
+        topic_files = {
+            fname for fname in md_names
+            if fname not in ("overview.md", "index.md") and not fname.endswith(".ref.md")
+        }
 
         if not topic_files:
             continue
@@ -570,7 +648,7 @@ def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
 
         # Extract linked filenames from the section
         linked_files = set()
-        for _text, target in re.findall(r"\[([^\]]*)\]\(([^)]+)\)", section_text):
+        for _text, target in _MD_LINK_RE.findall(section_text):
             target = target.strip().split("#")[0]
             if target and not target.startswith(("http://", "https://")):
                 linked_files.add(target)
@@ -591,26 +669,36 @@ def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
 # Duplicate content detection
 # ------------------------------------------------------------------
 
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+_SHINGLE_WORD_RE = re.compile(r"[a-z]+")
+
+
 def _extract_paragraphs(text: str) -> list[str]:
     """Split on double newlines, strip whitespace, filter to 40+ chars."""
-    paragraphs = re.split(r"\n\s*\n", text)
-    return [p.strip() for p in paragraphs if len(p.strip()) >= 40]
+    # Each block is stripped once; the split itself runs in the C regex engine
+    stripped = (p.strip() for p in _PARAGRAPH_BREAK_RE.split(text))
+    return [p for p in stripped if len(p) >= 40]
 
 
 def _word_shingles(text: str, n: int = 5) -> set[tuple]:
     """Create n-gram tuples as sliding window over words."""
-    words = re.findall(r"[a-z]+", text.lower())
+    words = _SHINGLE_WORD_RE.findall(text.lower())
     if len(words) < n:
         return set()
     return {tuple(words[i:i + n]) for i in range(len(words) - n + 1)}
 
 
 def _jaccard(a: set, b: set) -> float:
-    """Jaccard similarity: |a & b| / |a | b|."""
-    union = a | b
+    """Jaccard similarity: |a & b| / |a | b|.
+
+    The union size is derived from the intersection, so only the
+    intersection set is built for each of the O(N^2) file pairs.
+    """
+    intersection = len(a & b)
+    union = len(a) + len(b) - intersection
     if not union:
         return 0.0
-    return len(a & b) / len(union)
+    return intersection / union
 
 
 def _is_companion_pair(path_a: Path, path_b: Path) -> bool:
@@ -641,15 +729,9 @@ def check_duplicate_content(
 
     # Collect all .md files (areas + overviews)
     all_files: list[Path] = []
-    for child in sorted(knowledge_dir.iterdir()):
-        if not child.is_dir():
-            continue
-        if child.name.startswith("_") or child.name.startswith("."):
-            continue
-        for md_file in sorted(child.glob("*.md")):
-            if md_file.name == "index.md":
-                continue
-            all_files.append(md_file)
+    for area_name, md_names in _scan_area_md_names(knowledge_dir):
+        child = knowledge_dir / area_name
+        all_files.extend(child / fname for fname in md_names if fname != "index.md")
 
     if len(all_files) < 2:
         return issues
@@ -668,17 +750,27 @@ def check_duplicate_content(
         }
 
     # Pass 1 — exact paragraph duplicates
-    para_hash_map: dict[str, list[Path]] = {}
+    # Paragraph text is the key itself: str hashing is built in and already
+    # cached on the object, so no encode + digest is needed per paragraph
+    # Most paragraphs are unique, so only the first file is kept per
+    # paragraph; a file set is built only once a paragraph repeats
+    para_first_file: dict[str, Path] = {}
+    para_files_map: dict[str, set[Path]] = {}
     for f, data in file_data.items():
         for para in data["paragraphs"]:
-            h = hashlib.md5(para.encode()).hexdigest()
-            if h not in para_hash_map:
-                para_hash_map[h] = []
-            para_hash_map[h].append(f)
+            first = para_first_file.setdefault(para, f)
+            if first != f:
+                if para not in para_files_map:
+                    para_files_map[para] = {first}
+                para_files_map[para].add(f)
 
     reported_para_pairs: set[tuple] = set()
-    for h, files in para_hash_map.items():
-        unique_files = sorted(set(files), key=lambda p: str(p))
+    # Walk in first-seen order so issues come out as before
+    for para in para_first_file:
+        files = para_files_map.get(para)
+        if files is None:
+            continue
+        unique_files = sorted(files, key=lambda p: str(p))
         if len(unique_files) < 2:
             continue
         for i in range(len(unique_files)):
@@ -704,6 +796,11 @@ def check_duplicate_content(
             shingles_b = file_data[b]["shingles"]
             if not shingles_a or not shingles_b:
                 continue
+            # Jaccard can never exceed min/max of the set sizes, so pairs
+            # whose sizes are too far apart skip the set intersection
+            len_a, len_b = len(shingles_a), len(shingles_b)
+            if min(len_a, len_b) <= similarity_threshold * max(len_a, len_b):
+                continue
             sim = _jaccard(shingles_a, shingles_b)
             if sim > similarity_threshold:
                 rel_a = str(a.relative_to(knowledge_dir))
@@ -738,11 +835,8 @@ def check_naming_conventions(
 
     exempt_filenames = {"overview.md", "index.md"}
 
-    for child in sorted(knowledge_dir.iterdir()):
-        if not child.is_dir():
-            continue
-        if child.name.startswith("_") or child.name.startswith("."):
-            continue
+    for area_name, md_names in _scan_area_md_names(knowledge_dir):
+        child = knowledge_dir / area_name
 
         # Check area directory name
         if child.name != _slugify(child.name):
@@ -753,9 +847,10 @@ def check_naming_conventions(
             })
 
         # Check files within area
-        for md_file in sorted(child.glob("*.md")):
-            if md_file.name in exempt_filenames:
+        for fname in md_names:
+            if fname in exempt_filenames:
                 continue
+            md_file = child / fname
 
             # For .ref.md files, check the stem before .ref.md
             if md_file.name.endswith(".ref.md"):
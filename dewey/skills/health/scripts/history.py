@@ -9,6 +9,7 @@ Only stdlib is used.
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -17,6 +18,9 @@ from typing import Optional
 _LOG_DIR = Path(".dewey") / "history"
 _LOG_FILE = "health-log.jsonl"
 
+# First chunk size when reading the log backwards from its end
+_TAIL_BLOCK = 64 * 1024
+
 
 def record_snapshot(
     knowledge_base_root: Path,
@@ -62,18 +66,46 @@ def record_snapshot(
     return log_path
 
 
+def _read_tail_lines(log_file: Path, limit: int) -> list[bytes]:
+    """Return the last *limit* non-blank lines of *log_file*.
+
+    The file is read backwards in chunks that start at ``_TAIL_BLOCK`` and
+    double each round, until they hold *limit* complete lines, so the cost
+    follows the snapshots asked for rather than the length of the log.  A
+    *limit* of zero or less reads the whole file.  Raises
+    ``FileNotFoundError`` if it is missing.
+    """
+    lines: list[bytes] = []
+    block = _TAIL_BLOCK
+    with log_file.open("rb") as fh:
+        pos = fh.seek(0, os.SEEK_END)
+        data = b""
+        while pos > 0:
+            step = pos if limit <= 0 else min(block, pos)
+            block *= 2
+            pos -= step
+            fh.seek(pos)
+            data = fh.read(step) + data
+            lines = data.split(b"\n")
+            if pos > 0:
+                # Reading stopped mid-file, so the first line may be partial
+                del lines[0]
+            lines = [line for line in lines if line.strip()]
+            if 0 < limit <= len(lines):
+                break
+    return lines[-limit:]
+
+
 def read_history(knowledge_base_root: Path, limit: int = 10) -> list[dict]:
     """Read the last *limit* health check snapshots.
 
     Returns snapshots in chronological order (oldest first).
     """
     log_file = knowledge_base_root / ".dewey" / "history" / "health-log.jsonl"
-    if not log_file.exists():
-        return []
-
-    lines = log_file.read_text().strip().split("\n")
-    if not lines or lines == [""]:
+    try:
+        # Only the tail of the log is read; json.loads accepts UTF-8 bytes
+        lines = _read_tail_lines(log_file, limit)
+    except FileNotFoundError:
         return []
 
-    entries = [json.loads(line) for line in lines]
-    return entries[-limit:]
+    return [json.loads(line) for line in lines]
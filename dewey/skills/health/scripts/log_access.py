@@ -41,14 +41,18 @@ def log_if_knowledge_file(knowledge_base_root: Path, file_path: str) -> bool:
     if path.suffix != ".md":
         return False
 
-    if not path.exists():
+    # A strict resolve doubles as the existence check, saving a stat()
+    # on every hook invocation
+    try:
+        resolved = path.resolve(strict=True)
+    except (OSError, RuntimeError):  # missing, or a symlink loop
         return False
 
     knowledge_dir_name = read_knowledge_dir(knowledge_base_root)
     knowledge_dir = (knowledge_base_root / knowledge_dir_name).resolve()
 
     try:
-        rel = path.resolve().relative_to(knowledge_dir)
+        rel = resolved.relative_to(knowledge_dir)
     except ValueError:
         return False
 
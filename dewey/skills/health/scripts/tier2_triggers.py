@@ -41,6 +41,17 @@ DEPTH_PROSE_RANGES: dict[str, tuple[float, float]] = {
 # Module-internal helpers
 # ------------------------------------------------------------------
 
+# Compiled once per process and shared by every file the triggers visit
+_NUMBERED_ITEM_RE = re.compile(r"^\d+\.\s")
+# Headings, bullet list items, code fences and table rows
+_NON_PROSE_PREFIXES = ("#", "- ", "* ", "```", "|")
+_LIST_ITEM_RE = re.compile(r"^\s*[-*]\s+")
+_LIST_ITEM_LINE_RE = re.compile(r"^[\s]*[-*]\s+", re.MULTILINE)
+_EXTERNAL_LINK_RE = re.compile(r"\[([^\]]*)\]\((https?://[^)]+)\)")
+_TABLE_ROW_RE = re.compile(r"^\s*\|", re.MULTILINE)
+_NUMERIC_EXAMPLE_RE = re.compile(r"\d+(\.\d+)?%|\$\d|\d{2,}")
+_PROVENANCE_RE = re.compile(r"<!--\s*dewey:provenance\s*(.*?)-->", re.DOTALL)
+
 
 def _count_words(text: str) -> int:
     """Count words via simple split."""
@@ -53,25 +64,22 @@ def _compute_prose_ratio(body: str) -> float:
     Non-prose lines: headings (``#``), list items (``- `` / ``* `` / ``1. ``),
     code fences (`` ``` ``), table rows (``|``), blank lines.
     """
-    lines = body.split("\n")
-    non_blank = [l for l in lines if l.strip()]
-    if not non_blank:
-        return 0.0
-
+    # Single pass: each line is stripped once and only counted, so no
+    # intermediate list of non-blank lines is built
+    non_blank_count = 0
     prose_count = 0
-    for line in non_blank:
+    for line in body.split("\n"):
         stripped = line.strip()
-        if stripped.startswith("#"):
+        if not stripped:
             continue
-        if stripped.startswith(("- ", "* ")) or re.match(r"^\d+\.\s", stripped):
-            continue
-        if stripped.startswith("```"):
-            continue
-        if stripped.startswith("|"):
+        non_blank_count += 1
+        if stripped.startswith(_NON_PROSE_PREFIXES) or _NUMBERED_ITEM_RE.match(stripped):
             continue
         prose_count += 1
 
-    return prose_count / len(non_blank)
+    if not non_blank_count:
+        return 0.0
+    return prose_count / non_blank_count
 
 
 def _extract_source_urls(fm: dict) -> list[str]:
@@ -227,11 +235,11 @@ def trigger_source_primacy(file_path: Path) -> list[dict]:
         sections_checked.append(section_name)
 
         # Count recommendation items (list items starting with - or *)
-        items = re.findall(r"^[\s]*[-*]\s+", section, re.MULTILINE)
+        items = _LIST_ITEM_LINE_RE.findall(section)
         recommendation_count += len(items)
 
         # Count external markdown links
-        links = re.findall(r"\[([^\]]*)\]\((https?://[^)]+)\)", section)
+        links = _EXTERNAL_LINK_RE.findall(section)
         inline_source_count += len(links)
 
     if not sections_checked or recommendation_count == 0:
@@ -335,8 +343,8 @@ def trigger_concrete_examples(file_path: Path) -> list[dict]:
         return results
 
     has_code_block = "```" in section
-    has_table = bool(re.search(r"^\s*\|", section, re.MULTILINE))
-    has_numeric_example = bool(re.search(r"\d+(\.\d+)?%|\$\d|\d{2,}", section))
+    has_table = bool(_TABLE_ROW_RE.search(section))
+    has_numeric_example = bool(_NUMERIC_EXAMPLE_RE.search(section))
     section_word_count = _count_words(section)
 
     if not has_code_block and not has_table and not has_numeric_example:
@@ -380,7 +388,7 @@ def trigger_citation_quality(file_path: Path) -> list[dict]:
         section = _extract_section(body, section_name)
         if section is None:
             continue
-        links = re.findall(r"\[([^\]]*)\]\((https?://[^)]+)\)", section)
+        links = _EXTERNAL_LINK_RE.findall(section)
         for _text, url in links:
             url_counts[url] = url_counts.get(url, 0) + 1
 
@@ -517,11 +525,7 @@ def trigger_provenance_completeness(file_path: Path) -> list[dict]:
         return results
 
     # Check for provenance block
-    prov_match = re.search(
-        r"<!--\s*dewey:provenance\s*(.*?)-->",
-        section,
-        re.DOTALL,
-    )
+    prov_match = _PROVENANCE_RE.search(section)
 
     if not prov_match:
         results.append({
@@ -606,9 +610,10 @@ def trigger_recommendation_coverage(file_path: Path) -> list[dict]:
 
         for line in section.split("\n"):
             # Match list items
-            if re.match(r"^\s*[-*]\s+", line):
+            if _LIST_ITEM_RE.match(line):
                 total_recs += 1
-                if re.search(r"\[[^\]]*\]\(https?://[^)]+\)", line):
+                # Substring test first; most list items carry no link
+                if "](http" in line and _EXTERNAL_LINK_RE.search(line):
                     cited_recs += 1
 
     if total_recs == 0:
@@ -66,15 +66,16 @@ def read_utilization(knowledge_base_root: Path) -> dict[str, dict]:
     {"count": int, "first_referenced": str, "last_referenced": str}.
     """
     log_file = knowledge_base_root / ".dewey" / "utilization" / "log.jsonl"
-    if not log_file.exists():
+    try:
+        # json.loads accepts UTF-8 bytes, so skip decoding the whole log
+        data = log_file.read_bytes().strip()
+    except FileNotFoundError:
         return {}
-
-    lines = log_file.read_text().strip().split("\n")
-    if not lines or lines == [""]:
+    if not data:
         return {}
 
     stats: dict[str, dict] = {}
-    for line in lines:
+    for line in data.split(b"\n"):
         entry = json.loads(line)
         fp = entry["file"]
         ts = entry["timestamp"]
@@ -9,11 +9,19 @@ Only stdlib is used.  No network requests are made (that belongs in Tier 2).
 
 from __future__ import annotations
 
-import hashlib
+import functools
+import os
 import re
+import urllib.error
 import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
+from typing import Optional
+
+from history import read_history
 
 # ------------------------------------------------------------------
 # Shared helpers
@@ -21,6 +29,9 @@ from pathlib import Path
 
 _VALID_DEPTHS = {"overview", "working", "reference"}
 
+# Upper bound on concurrent source-URL probes across the whole run
+_URL_WORKERS = 8
+
 _SIZE_BOUNDS: dict[str, tuple[int, int]] = {
     "overview": (5, 150),
     "working": (10, 400),
@@ -42,19 +53,15 @@ _OVERVIEW_SECTIONS = [
 
 
 def _body_without_frontmatter(text: str) -> str:
-    """Strip content between first two ``---`` lines."""
-    lines = text.split("\n")
-    delimiter_count = 0
-    start = 0
-    for idx, line in enumerate(lines):
-        if line.strip() == "---":
-            delimiter_count += 1
-            if delimiter_count == 2:
-                start = idx + 1
-                break
-    if delimiter_count < 2:
+    """Strip content between first two ``---`` lines.
+
+    Slices past the closing delimiter rather than splitting and re-joining
+    every line; this runs for nearly every validator and trigger.
+    """
+    delimiters = _find_fm_delimiters(text)
+    if delimiters is None:
         return text
-    return "\n".join(lines[start:])
+    return text[delimiters[1].end() + 1:]
 
 
 def _extract_section(body: str, heading: str) -> str | None:
@@ -100,35 +107,99 @@ def _strip_fenced_code_blocks(text: str) -> str:
     return "\n".join(result)
 
 
+def _first_heading_with(text: str, phrase: str) -> int:
+    """Return the offset of the first ``## `` heading line containing *phrase*.
+
+    Returns -1 when no H2 heading contains *phrase*.  Only the lines holding
+    an occurrence of *phrase* are inspected, so no heading list is built.
+    """
+    pos = text.find(phrase)
+    while pos != -1:
+        line_start = text.rfind("\n", 0, pos) + 1
+        if text.startswith("##", line_start) and text[line_start + 2:line_start + 3].isspace():
+            return line_start
+        pos = text.find(phrase, pos + len(phrase))
+    return -1
+
+
+def _resolve_existing(path: Path) -> Optional[Path]:
+    """Return *path* fully resolved if it exists, else ``None``.
+
+    ``resolve(strict=True)`` doubles as the existence check, so a valid link
+    costs no extra ``stat``.  On failure the lenient ``resolve()`` is retried
+    so paths such as ``missing/../file.md`` are judged as before.
+    """
+    try:
+        return path.resolve(strict=True)
+    except (OSError, RuntimeError):
+        pass
+    resolved = path.resolve()
+    return resolved if resolved.exists() else None
+
+
+# Markdown link [text](target), compiled once and shared with cross_validators
+_MD_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+
+# A line that is "---" once surrounding whitespace is stripped
+_FM_DELIMITER_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+_FM_LIST_ITEM_RE = re.compile(r"^\s+-\s+(.+)$")
+_FM_KEY_VALUE_RE = re.compile(r"^(\w[\w_]*):\s*(.*)$")
+# Frontmatter sits at the top of the file; read this much before the rest
+_FM_HEAD_CHARS = 4096
+
+
 def parse_frontmatter(file_path: Path) -> dict:
     """Parse YAML-like frontmatter between ``---`` delimiters.
 
     Returns a dict with simple ``key: value`` pairs.  List values
     (``sources``) are collected from subsequent ``  - item`` lines.
     No third-party YAML library is required.
+
+    Only the first ``_FM_HEAD_CHARS`` characters are read when the
+    frontmatter closes within them; the body is never loaded.
     """
-    text = file_path.read_text()
-    lines = text.split("\n")
+    with open(file_path) as fh:
+        text = fh.read(_FM_HEAD_CHARS)
+        if len(text) == _FM_HEAD_CHARS:
+            delimiters = _find_fm_delimiters(text)
+            # A fence ending exactly at the window edge may be a longer line
+            if delimiters is None or delimiters[1].end() == len(text):
+                text += fh.read()
+    return _parse_frontmatter_text(text)
+
+
+def _find_fm_delimiters(text: str) -> tuple[re.Match, re.Match] | None:
+    """Return the first two ``---`` delimiter-line matches in *text*."""
+    opening = _FM_DELIMITER_RE.search(text)
+    if opening is None:
+        return None
+    closing = _FM_DELIMITER_RE.search(text, opening.end())
+    if closing is None:
+        return None
+    return opening, closing
 
-    # Find the two --- delimiters
-    delimiter_indices: list[int] = []
-    for idx, line in enumerate(lines):
-        if line.strip() == "---":
-            delimiter_indices.append(idx)
-            if len(delimiter_indices) == 2:
-                break
 
-    if len(delimiter_indices) < 2:
+def _parse_frontmatter_text(text: str) -> dict:
+    """Parse frontmatter from already-read file *text*.
+
+    Lets validators that also need the body read the file only once.
+    """
+    # Locate the first two "---" lines without splitting the whole file
+    delimiters = _find_fm_delimiters(text)
+    if delimiters is None:
         return {}
+    opening, closing = delimiters
 
-    fm_lines = lines[delimiter_indices[0] + 1 : delimiter_indices[1]]
+    fm_start = opening.end() + 1
+    fm_end = closing.start() - 1
+    fm_lines = text[fm_start:fm_end].split("\n") if fm_end > fm_start else []
 
     result: dict = {}
     current_key: str | None = None
 
     for line in fm_lines:
         # List item: "  - value"
-        list_match = re.match(r"^\s+-\s+(.+)$", line)
+        list_match = _FM_LIST_ITEM_RE.match(line)
         if list_match and current_key is not None:
             if not isinstance(result.get(current_key), list):
                 result[current_key] = []
@@ -136,7 +207,7 @@ def parse_frontmatter(file_path: Path) -> dict:
             continue
 
         # Key-value: "key: value"
-        kv_match = re.match(r"^(\w[\w_]*):\s*(.*)$", line)
+        kv_match = _FM_KEY_VALUE_RE.match(line)
         if kv_match:
             key = kv_match.group(1)
             value = kv_match.group(2).strip()
@@ -156,11 +227,11 @@ def parse_frontmatter(file_path: Path) -> dict:
 # ------------------------------------------------------------------
 
 
-def check_frontmatter(file_path: Path) -> list[dict]:
+def check_frontmatter(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Validate that required frontmatter fields are present and valid."""
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    fm = parse_frontmatter(file_path) if text is None else _parse_frontmatter_text(text)
 
     if not fm:
         issues.append({"file": name, "message": "Missing frontmatter", "severity": "fail"})
@@ -197,28 +268,26 @@ def check_frontmatter(file_path: Path) -> list[dict]:
     return issues
 
 
-def check_section_ordering(file_path: Path) -> list[dict]:
+def check_section_ordering(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Ensure 'In Practice' appears before 'Key Guidance' in working-depth files."""
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    if text is None:
+        text = file_path.read_text()
+    fm = _parse_frontmatter_text(text)
 
     if fm.get("depth") != "working":
         return issues
 
-    text = file_path.read_text()
-    headings = re.findall(r"^##\s+(.+)$", text, re.MULTILINE)
+    # Most files lack one of the headings entirely -- skip the scan
+    if "In Practice" not in text or "Key Guidance" not in text:
+        return issues
 
-    in_practice_idx: int | None = None
-    key_guidance_idx: int | None = None
-    for idx, h in enumerate(headings):
-        if "In Practice" in h and in_practice_idx is None:
-            in_practice_idx = idx
-        if "Key Guidance" in h and key_guidance_idx is None:
-            key_guidance_idx = idx
+    in_practice_pos = _first_heading_with(text, "In Practice")
+    key_guidance_pos = _first_heading_with(text, "Key Guidance")
 
-    if in_practice_idx is not None and key_guidance_idx is not None:
-        if key_guidance_idx < in_practice_idx:
+    if in_practice_pos != -1 and key_guidance_pos != -1:
+        if key_guidance_pos < in_practice_pos:
             issues.append({
                 "file": name,
                 "message": "'In Practice' must appear before 'Key Guidance' (concrete before abstract)",
@@ -228,14 +297,57 @@ def check_section_ordering(file_path: Path) -> list[dict]:
     return issues
 
 
-def check_cross_references(file_path: Path, knowledge_base_root: Path) -> list[dict]:
-    """Check that internal markdown links point to existing files."""
+def collect_existing_paths(root: Path) -> set[str]:
+    """Return normalized absolute paths of every file and directory under *root*.
+
+    Built once per health-check run and passed to ``check_cross_references``
+    so that link targets resolve with a set lookup instead of per-link
+    ``resolve()`` + ``exists()`` syscalls.
+    """
+    existing: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(os.path.abspath(root)):
+        existing.add(dirpath)
+        for entry in dirnames:
+            existing.add(os.path.join(dirpath, entry))
+        for entry in filenames:
+            existing.add(os.path.join(dirpath, entry))
+    return existing
+
+
+def check_cross_references(
+    file_path: Path,
+    knowledge_base_root: Path,
+    *,
+    existing_paths: Optional[set[str]] = None,
+    text: Optional[str] = None,
+) -> list[dict]:
+    """Check that internal markdown links point to existing files.
+
+    Parameters
+    ----------
+    file_path:
+        Markdown file whose links are checked.
+    knowledge_base_root:
+        Root directory of the knowledge base.
+    existing_paths:
+        Optional set from ``collect_existing_paths``.  Link targets found in
+        the set are accepted without touching the filesystem; misses fall
+        back to a full path resolution so links outside the indexed
+        tree (or through symlinks) are still judged correctly.
+    text:
+        Contents of *file_path* when the caller has already read it.
+        Read from disk when *None*.
+    """
     issues: list[dict] = []
     name = str(file_path)
-    text = file_path.read_text()
+    if text is None:
+        text = file_path.read_text()
+    if "](" not in text:
+        return issues
+    parent = os.path.abspath(file_path.parent)
 
     # Match [text](path) — exclude URLs (http/https), anchors (#), and mailto
-    links = re.findall(r"\[([^\]]*)\]\(([^)]+)\)", text)
+    links = _MD_LINK_RE.findall(text)
     for _link_text, target in links:
         target = target.strip()
         # Skip external URLs, anchors, and mailto
@@ -245,8 +357,10 @@ def check_cross_references(file_path: Path, knowledge_base_root: Path) -> list[d
         target_path = target.split("#")[0]
         if not target_path:
             continue
-        resolved = (file_path.parent / target_path).resolve()
-        if not resolved.exists():
+        if existing_paths is not None:
+            if os.path.normpath(os.path.join(parent, target_path)) in existing_paths:
+                continue
+        if _resolve_existing(file_path.parent / target_path) is None:
             issues.append({
                 "file": name,
                 "message": f"Broken internal link: {target_path}",
@@ -256,17 +370,19 @@ def check_cross_references(file_path: Path, knowledge_base_root: Path) -> list[d
     return issues
 
 
-def check_size_bounds(file_path: Path) -> list[dict]:
+def check_size_bounds(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Warn if file line count is outside expected range for its depth."""
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    if text is None:
+        text = file_path.read_text()
+    fm = _parse_frontmatter_text(text)
     depth = fm.get("depth")
 
     if depth not in _SIZE_BOUNDS:
         return issues
 
-    line_count = len(file_path.read_text().splitlines())
+    line_count = len(text.splitlines())
     lo, hi = _SIZE_BOUNDS[depth]
 
     if line_count < lo:
@@ -293,15 +409,21 @@ def check_coverage(knowledge_base_root: Path, *, knowledge_dir_name: str = "docs
     if not knowledge_dir.is_dir():
         return issues
 
-    for child in sorted(knowledge_dir.iterdir()):
-        if not child.is_dir():
-            continue
+    # One scandir per directory; companion and overview checks are then
+    # set lookups instead of a stat() per file
+    with os.scandir(knowledge_dir) as it:
+        area_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+    for entry in area_entries:
         # Skip _proposals, hidden directories, and other special directories
-        if child.name.startswith("_") or child.name.startswith("."):
+        if entry.name.startswith(("_", ".")):
             continue
+        child = knowledge_dir / entry.name
+        with os.scandir(entry.path) as it:
+            names = {e.name for e in it}
 
         # Every area directory must have an overview.md
-        if not (child / "overview.md").exists():
+        if "overview.md" not in names:
             issues.append({
                 "file": str(child),
                 "message": f"Area '{child.name}' missing overview.md",
@@ -309,28 +431,48 @@ def check_coverage(knowledge_base_root: Path, *, knowledge_dir_name: str = "docs
             })
 
         # Every .md file (not overview.md, not .ref.md) should have a .ref.md
-        for md_file in sorted(child.glob("*.md")):
-            if md_file.name == "overview.md":
+        for fname in sorted(names):
+            if not fname.endswith(".md") or fname == "overview.md":
                 continue
-            if md_file.name.endswith(".ref.md"):
+            if fname.endswith(".ref.md"):
                 continue
-            stem = md_file.stem  # e.g. "bidding" from "bidding.md"
-            ref_file = child / f"{stem}.ref.md"
-            if not ref_file.exists():
+            stem = fname[:-3]  # e.g. "bidding" from "bidding.md"
+            if f"{stem}.ref.md" not in names:
                 issues.append({
-                    "file": str(md_file),
-                    "message": f"Topic '{md_file.name}' missing companion {stem}.ref.md",
+                    "file": str(child / fname),
+                    "message": f"Topic '{fname}' missing companion {stem}.ref.md",
                     "severity": "warn",
                 })
 
     return issues
 
 
-def check_freshness(file_path: Path, max_age_days: int = 90) -> list[dict]:
-    """Warn if last_validated date is older than *max_age_days*."""
+def check_freshness(
+    file_path: Path,
+    max_age_days: int = 90,
+    *,
+    today: Optional[date] = None,
+    text: Optional[str] = None,
+) -> list[dict]:
+    """Warn if last_validated date is older than *max_age_days*.
+
+    Parameters
+    ----------
+    file_path:
+        Markdown file to check.
+    max_age_days:
+        Maximum allowed age in days.
+    today:
+        Reference date for the age computation.  Batch callers pass the
+        same value for every file so a run that spans midnight ages all
+        files consistently.  Defaults to ``date.today()``.
+    text:
+        Contents of *file_path* when the caller has already read it.
+        Read from disk when *None*.
+    """
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    fm = parse_frontmatter(file_path) if text is None else _parse_frontmatter_text(text)
     last_validated = fm.get("last_validated")
 
     if not last_validated:
@@ -346,7 +488,9 @@ def check_freshness(file_path: Path, max_age_days: int = 90) -> list[dict]:
         })
         return issues
 
-    age = (date.today() - validated_date).days
+    if today is None:
+        today = date.today()
+    age = (today - validated_date).days
     if age > max_age_days:
         issues.append({
             "file": name,
@@ -357,11 +501,11 @@ def check_freshness(file_path: Path, max_age_days: int = 90) -> list[dict]:
     return issues
 
 
-def check_source_urls(file_path: Path) -> list[dict]:
+def check_source_urls(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Validate that source URLs in frontmatter are well-formed."""
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    fm = parse_frontmatter(file_path) if text is None else _parse_frontmatter_text(text)
     sources = fm.get("sources")
 
     if not isinstance(sources, list):
@@ -406,22 +550,24 @@ def check_index_sync(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
 
     index_text = index_path.read_text()
 
-    # Collect all topic .md files on disk (excluding overview, ref, proposals, index)
-    for child in sorted(knowledge_dir.iterdir()):
-        if not child.is_dir():
-            continue
-        if child.name.startswith("_"):
+    # Collect all topic .md files on disk (excluding overview, ref, proposals, index).
+    # scandir + suffix test avoids glob's pattern matching and per-entry Paths
+    with os.scandir(knowledge_dir) as it:
+        area_entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+    for entry in area_entries:
+        if entry.name.startswith("_"):
             continue
-        for md_file in sorted(child.glob("*.md")):
-            if md_file.name == "overview.md":
-                continue
-            if md_file.name.endswith(".ref.md"):
+        with os.scandir(entry.path) as it:
+            names = sorted(e.name for e in it if e.name.endswith(".md"))
+        for fname in names:
+            if fname == "overview.md" or fname.endswith(".ref.md"):
                 continue
             # Check if this file is referenced in index.md
-            relative_ref = f"{child.name}/{md_file.name}"
+            relative_ref = f"{entry.name}/{fname}"
             if relative_ref not in index_text:
                 issues.append({
-                    "file": str(md_file),
+                    "file": str(knowledge_dir / entry.name / fname),
                     "message": f"Topic not in index.md: {relative_ref} — run scaffold --rebuild-index",
                     "severity": "warn",
                 })
@@ -437,8 +583,6 @@ def check_inventory_regression(knowledge_base_root: Path, current_files: list[st
     snapshot.  Returns a warning for each file that was present
     previously but is absent now.
     """
-    from history import read_history
-
     issues: list[dict] = []
     history = read_history(knowledge_base_root, limit=1)
     if not history:
@@ -463,11 +607,13 @@ def check_inventory_regression(knowledge_base_root: Path, current_files: list[st
 # ------------------------------------------------------------------
 
 
-def check_section_completeness(file_path: Path) -> list[dict]:
+def check_section_completeness(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Check that depth-appropriate sections are present."""
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    if text is None:
+        text = file_path.read_text()
+    fm = _parse_frontmatter_text(text)
     depth = fm.get("depth")
 
     if depth == "working":
@@ -476,7 +622,6 @@ def check_section_completeness(file_path: Path) -> list[dict]:
         expected = _OVERVIEW_SECTIONS
     elif depth == "reference":
         # Reference files just need a non-empty body
-        text = file_path.read_text()
         body = _body_without_frontmatter(text).strip()
         if not body:
             issues.append({
@@ -488,12 +633,12 @@ def check_section_completeness(file_path: Path) -> list[dict]:
     else:
         return issues
 
-    text = file_path.read_text()
-    headings = re.findall(r"^##\s+(.+)$", text, re.MULTILINE)
-    heading_lower = [h.lower() for h in headings]
+    # Headings never contain a newline, so one substring search over the
+    # joined text replaces a scan of every heading per expected section
+    headings = "\n".join(re.findall(r"^##\s+(.+)$", text, re.MULTILINE)).lower()
 
     for section in expected:
-        if not any(section.lower() in h for h in heading_lower):
+        if section.lower() not in headings:
             issues.append({
                 "file": name,
                 "message": f"Missing required section: {section}",
@@ -503,11 +648,12 @@ def check_section_completeness(file_path: Path) -> list[dict]:
     return issues
 
 
-def check_heading_hierarchy(file_path: Path) -> list[dict]:
+def check_heading_hierarchy(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Check heading structure: exactly one H1, no skipped levels."""
     issues: list[dict] = []
     name = str(file_path)
-    text = file_path.read_text()
+    if text is None:
+        text = file_path.read_text()
     body = _body_without_frontmatter(text)
     body = _strip_fenced_code_blocks(body)
 
@@ -544,7 +690,7 @@ def check_heading_hierarchy(file_path: Path) -> list[dict]:
     return issues
 
 
-def check_go_deeper_links(file_path: Path) -> list[dict]:
+def check_go_deeper_links(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Check that Go Deeper section links to companion ref and external sources."""
     issues: list[dict] = []
     name = str(file_path)
@@ -553,11 +699,12 @@ def check_go_deeper_links(file_path: Path) -> list[dict]:
     if file_path.name.endswith(".ref.md"):
         return issues
 
-    fm = parse_frontmatter(file_path)
+    if text is None:
+        text = file_path.read_text()
+    fm = _parse_frontmatter_text(text)
     if fm.get("depth") != "working":
         return issues
 
-    text = file_path.read_text()
     body = _body_without_frontmatter(text)
     section = _extract_section(body, "Go Deeper")
 
@@ -586,7 +733,7 @@ def check_go_deeper_links(file_path: Path) -> list[dict]:
     return issues
 
 
-def check_ref_see_also(file_path: Path) -> list[dict]:
+def check_ref_see_also(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Check that .ref.md files have a See Also linking to companion."""
     issues: list[dict] = []
     name = str(file_path)
@@ -594,7 +741,8 @@ def check_ref_see_also(file_path: Path) -> list[dict]:
     if not file_path.name.endswith(".ref.md"):
         return issues
 
-    text = file_path.read_text()
+    if text is None:
+        text = file_path.read_text()
     body = _body_without_frontmatter(text)
 
     # Check for "see also" text (case-insensitive)
@@ -678,14 +826,16 @@ def _flesch_kincaid_grade(text: str) -> float | None:
     if len(sentences) < 3:
         return None
 
-    words: list[str] = []
-    for sentence in sentences:
-        words.extend(re.findall(r"[a-zA-Z]+", sentence))
+    # Sentence delimiters are never letters, so the words of all sentences
+    # are exactly the words of the whole text
+    words = re.findall(r"[a-zA-Z]+", text)
 
     if not words:
         return None
 
-    total_syllables = sum(_count_syllables(w) for w in words)
+    # Prose repeats words heavily; score each distinct word only once
+    word_counts = Counter(words)
+    total_syllables = sum(n * _count_syllables(w) for w, n in word_counts.items())
     num_words = len(words)
     num_sentences = len(sentences)
 
@@ -693,18 +843,19 @@ def _flesch_kincaid_grade(text: str) -> float | None:
     return grade
 
 
-def check_readability(file_path: Path) -> list[dict]:
+def check_readability(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Check Flesch-Kincaid grade level is within bounds for the content depth."""
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    if text is None:
+        text = file_path.read_text()
+    fm = _parse_frontmatter_text(text)
     depth = fm.get("depth")
 
     # Skip reference files (terse by design)
     if depth not in _FK_GRADE_BOUNDS:
         return issues
 
-    text = file_path.read_text()
     body = _body_without_frontmatter(text)
     body = _strip_fenced_code_blocks(body)
     body = _strip_markdown_formatting(body)
@@ -755,11 +906,12 @@ _MANAGED_MARKERS = [
 ]
 
 
-def check_placeholder_comments(file_path: Path) -> list[dict]:
+def check_placeholder_comments(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Detect unfilled template placeholders left in a file."""
     issues: list[dict] = []
     name = str(file_path)
-    text = file_path.read_text()
+    if text is None:
+        text = file_path.read_text()
 
     found: list[str] = []
     for pattern in _PLACEHOLDER_PATTERNS:
@@ -800,11 +952,11 @@ def _extract_source_domains(fm: dict) -> list[str]:
     return domains
 
 
-def check_source_diversity(file_path: Path) -> list[dict]:
+def check_source_diversity(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Warn when all frontmatter sources come from a single domain."""
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    fm = parse_frontmatter(file_path) if text is None else _parse_frontmatter_text(text)
     domains = _extract_source_domains(fm)
 
     if len(domains) < 2:
@@ -821,11 +973,13 @@ def check_source_diversity(file_path: Path) -> list[dict]:
     return issues
 
 
-def check_citation_grounding(file_path: Path) -> list[dict]:
+def check_citation_grounding(file_path: Path, *, text: Optional[str] = None) -> list[dict]:
     """Warn when inline URLs in body are not grounded in frontmatter sources."""
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    if text is None:
+        text = file_path.read_text()
+    fm = _parse_frontmatter_text(text)
 
     if fm.get("depth") != "working":
         return issues
@@ -834,7 +988,6 @@ def check_citation_grounding(file_path: Path) -> list[dict]:
     if not fm_domains:
         return issues
 
-    text = file_path.read_text()
     body = _body_without_frontmatter(text)
 
     # Extract inline external URLs: [text](https://...)
@@ -858,23 +1011,56 @@ def check_citation_grounding(file_path: Path) -> list[dict]:
     return issues
 
 
-def check_source_accessibility(file_path: Path, *, timeout: int = 10) -> list[dict]:
+@functools.lru_cache(maxsize=1)
+def _url_probe_executor() -> ThreadPoolExecutor:
+    """Return the single pool every source-URL probe runs on.
+
+    Sharing one pool caps concurrent requests at ``_URL_WORKERS`` however
+    many files are being checked.
+    """
+    return ThreadPoolExecutor(max_workers=_URL_WORKERS)
+
+
+def _probe_url(url: str, timeout: int) -> str | None:
+    """Return None if *url* answers, else the status to report."""
+    try:
+        req = urllib.request.Request(url, method="HEAD")
+        req.add_header("User-Agent", "dewey-health-check/1.0")
+        urllib.request.urlopen(req, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.code != 405:
+            return str(e.code)
+        # HEAD not allowed — retry with GET
+        try:
+            req = urllib.request.Request(url, method="GET")
+            req.add_header("User-Agent", "dewey-health-check/1.0")
+            urllib.request.urlopen(req, timeout=timeout)
+        except Exception as e2:
+            return str(getattr(e2, "code", "error"))
+    except Exception:
+        return "timeout/error"
+    return None
+
+
+def check_source_accessibility(
+    file_path: Path, *, timeout: int = 10, text: Optional[str] = None,
+) -> list[dict]:
     """Check that frontmatter source URLs are reachable (opt-in, requires network).
 
     Not included in the default health check pipeline.  Gated behind
-    ``check_links=True`` / ``--check-links`` on the CLI.
+    ``check_links=True`` / ``--check-links`` on the CLI.  URLs are probed
+    concurrently on a pool shared by all files, since each request mostly
+    waits on the network.
     """
-    import urllib.request
-    import urllib.error
-
     issues: list[dict] = []
     name = str(file_path)
-    fm = parse_frontmatter(file_path)
+    fm = parse_frontmatter(file_path) if text is None else _parse_frontmatter_text(text)
     sources = fm.get("sources")
 
     if not isinstance(sources, list):
         return issues
 
+    urls: list[str] = []
     for entry in sources:
         url = str(entry).strip()
         if url.startswith("url:"):
@@ -883,35 +1069,15 @@ def check_source_accessibility(file_path: Path, *, timeout: int = 10) -> list[di
             continue
         if not url.startswith(("http://", "https://")):
             continue
+        urls.append(url)
 
-        try:
-            req = urllib.request.Request(url, method="HEAD")
-            req.add_header("User-Agent", "dewey-health-check/1.0")
-            urllib.request.urlopen(req, timeout=timeout)
-        except urllib.error.HTTPError as e:
-            if e.code == 405:
-                # HEAD not allowed — retry with GET
-                try:
-                    req = urllib.request.Request(url, method="GET")
-                    req.add_header("User-Agent", "dewey-health-check/1.0")
-                    urllib.request.urlopen(req, timeout=timeout)
-                except Exception as e2:
-                    status = getattr(e2, "code", "error")
-                    issues.append({
-                        "file": name,
-                        "message": f"Source URL unreachable ({status}): {url}",
-                        "severity": "warn",
-                    })
-            else:
-                issues.append({
-                    "file": name,
-                    "message": f"Source URL unreachable ({e.code}): {url}",
-                    "severity": "warn",
-                })
-        except Exception:
+    statuses = _url_probe_executor().map(functools.partial(_probe_url, timeout=timeout), urls)
+
+    for url, status in zip(urls, statuses):
+        if status is not None:
             issues.append({
                 "file": name,
-                "message": f"Source URL unreachable (timeout/error): {url}",
+                "message": f"Source URL unreachable ({status}): {url}",
                 "severity": "warn",
             })
 
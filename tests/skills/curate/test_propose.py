@@ -41,6 +41,17 @@ class TestCreateProposal(unittest.TestCase):
         self.assertIn("status: proposal", content)
         self.assertIn("proposed_by: alice", content)
 
+    def test_does_not_overwrite_existing(self):
+        """An existing proposal is left untouched."""
+        path = self.tmpdir / "docs" / "_proposals" / "bid-strategies.md"
+        path.write_text("custom content")
+        result = create_proposal(
+            self.tmpdir, "Bid Strategies", relevance="core",
+            proposed_by="alice", rationale="Needed for optimization",
+        )
+        self.assertIn("already exists", result)
+        self.assertEqual(path.read_text(), "custom content")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,11 +3,13 @@
 import json
 import os
 import shutil
+import stat
 import tempfile
 import unittest
 from pathlib import Path
 
 from scaffold import (
+    _atomic_write,
     _discover_index_data,
     _parse_agents_topics,
     _read_topic_metadata,
@@ -366,6 +368,15 @@ class TestScaffoldKnowledgeBase(unittest.TestCase):
         result = scaffold_knowledge_base(self.tmpdir, "Analyst")
         self.assertIn(".claude/hooks.json", result)
 
+    def test_existing_overview_not_overwritten(self):
+        """Re-scaffold keeps an edited overview.md and omits it from the summary."""
+        scaffold_knowledge_base(self.tmpdir, "Analyst", domain_areas=["Testing"])
+        overview = self.tmpdir / "docs" / "testing" / "overview.md"
+        overview.write_text("# Testing\n\nEdited.\n")
+        result = scaffold_knowledge_base(self.tmpdir, "Analyst", domain_areas=["Testing"])
+        self.assertEqual(overview.read_text(), "# Testing\n\nEdited.\n")
+        self.assertNotIn("docs/testing/overview.md", result)
+
 
 class TestParseAgentsTopics(unittest.TestCase):
     """Tests for the _parse_agents_topics helper."""
@@ -390,11 +401,39 @@ class TestParseAgentsTopics(unittest.TestCase):
         self.assertEqual(result["Testing"][0]["description"], "How to test")
         self.assertEqual(result["Backend"], [])
 
+    def test_description_with_pipes_and_parens(self):
+        """Rows whose description contains ') | ' parse like the table regex."""
+        content = (
+            MARKER_BEGIN + "\n"
+            "### Testing\n"
+            "| [Mocks](docs/testing/mocks.md) | Fakes (stubs) | spies |\n"
+            "| not a row |\n"
+            + MARKER_END
+        )
+        result = _parse_agents_topics(content)
+        self.assertEqual(result["Testing"], [{
+            "name": "Mocks",
+            "path": "docs/testing/mocks.md",
+            "description": "Fakes (stubs) | spies",
+        }])
+
     def test_no_markers_returns_empty(self):
         """_parse_agents_topics returns empty dict when no markers present."""
         result = _parse_agents_topics("# Just a file\nNo markers here.")
         self.assertEqual(result, {})
 
+    def test_end_marker_before_begin_ignored(self):
+        """Only an end marker after the begin marker closes the section."""
+        content = (
+            MARKER_END + "\n"
+            + MARKER_BEGIN + "\n"
+            "### Testing\n"
+            "| [Unit Tests](docs/testing/unit-tests.md) | How to test |\n"
+            + MARKER_END
+        )
+        result = _parse_agents_topics(content)
+        self.assertEqual(result["Testing"][0]["name"], "Unit Tests")
+
 
 class TestMergeManagedSection(unittest.TestCase):
     """Tests for the merge_managed_section helper."""
@@ -447,6 +486,11 @@ class TestMergeManagedSection(unittest.TestCase):
         self.assertIn("After", result)
         self.assertIn("new", result)
 
+    def test_missing_end_marker_raises(self):
+        existing = "Before\n" + MARKER_BEGIN + "\nold\n"
+        with self.assertRaises(ValueError):
+            merge_managed_section(existing, "new", "unused")
+
 
 class TestDiscoverIndexData(unittest.TestCase):
     """Tests for _discover_index_data filesystem scanner."""
@@ -581,6 +625,18 @@ class TestDiscoverIndexData(unittest.TestCase):
         topic = result[0]["topics"][0]
         self.assertEqual(topic["name"], "some-topic")
 
+    def test_ignores_directories_named_like_markdown(self):
+        """Only regular .md files are treated as topics."""
+        area = self.knowledge_base / "testing"
+        self._write(area / "overview.md", self._valid_overview("Testing"))
+        (area / "assets.md").mkdir()
+        self._write(area / "topic.md", self._valid_topic("Topic"))
+
+        result = _discover_index_data(self.tmpdir, "docs")
+
+        filenames = [t["filename"] for t in result[0]["topics"]]
+        self.assertEqual(filenames, ["topic.md"])
+
 
 class TestReadTopicMetadata(unittest.TestCase):
     """Tests for _read_topic_metadata helper."""
@@ -624,6 +680,56 @@ class TestReadTopicMetadata(unittest.TestCase):
         self.assertEqual(result["name"], "")
         self.assertEqual(result["depth"], "working")
 
+    def test_ignores_comment_inside_frontmatter(self):
+        """A YAML comment line in frontmatter is not mistaken for the H1."""
+        path = self.tmpdir / "topic.md"
+        path.write_text("---\n# generated\ndepth: working\n---\n# Real Title\n")
+        result = _read_topic_metadata(path)
+        self.assertEqual(result, {"name": "Real Title", "depth": "working"})
+
+    def test_accepts_string_path(self):
+        """Accepts a plain path string such as os.DirEntry.path."""
+        path = self.tmpdir / "topic.md"
+        path.write_text("---\ndepth: reference\n---\n# Str Topic\n")
+        result = _read_topic_metadata(str(path))
+        self.assertEqual(result, {"name": "Str Topic", "depth": "reference"})
+
+    def test_accepts_dir_entry(self):
+        """Accepts an os.DirEntry and reuses its stat result."""
+        path = self.tmpdir / "topic.md"
+        path.write_text("---\ndepth: overview\n---\n# Entry Topic\n")
+        with os.scandir(self.tmpdir) as it:
+            entry = next(e for e in it if e.name == "topic.md")
+        result = _read_topic_metadata(entry)
+        self.assertEqual(result, {"name": "Entry Topic", "depth": "overview"})
+
+    def test_reads_heading_beyond_header_window(self):
+        """Long frontmatter pushing the H1 past the first read still parses."""
+        sources = "".join(
+            f"  - url: https://example.com/{i}\n    title: Source {i}\n"
+            for i in range(200)
+        )
+        path = self.tmpdir / "topic.md"
+        path.write_text(f"---\nsources:\n{sources}depth: working\n---\n# Late Topic\n")
+        result = _read_topic_metadata(path)
+        self.assertEqual(result, {"name": "Late Topic", "depth": "working"})
+
+    def test_ignores_body_after_heading(self):
+        """Only the first H1 is used even when the body is large."""
+        path = self.tmpdir / "topic.md"
+        path.write_text("---\ndepth: working\n---\n# First\n" + "text\n" * 5000 + "# Second\n")
+        result = _read_topic_metadata(path)
+        self.assertEqual(result["name"], "First")
+
+    def test_rereads_file_after_change(self):
+        """Cached metadata is refreshed when the file changes on disk."""
+        path = self.tmpdir / "topic.md"
+        path.write_text("---\ndepth: working\n---\n# Before\n")
+        self.assertEqual(_read_topic_metadata(path)["name"], "Before")
+        path.write_text("---\ndepth: reference\n---\n# After Edit\n")
+        result = _read_topic_metadata(path)
+        self.assertEqual(result, {"name": "After Edit", "depth": "reference"})
+
 
 class TestScaffoldIndexIncludesTopics(unittest.TestCase):
     """scaffold_knowledge_base regenerates index.md with discovered topics."""
@@ -652,6 +758,59 @@ class TestScaffoldIndexIncludesTopics(unittest.TestCase):
         self.assertFalse(index.startswith("---"))
 
 
+class TestAtomicWrite(unittest.TestCase):
+    """Tests for _atomic_write helper."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_replaces_existing_content(self):
+        """Overwrites an existing file with the new content."""
+        path = self.tmpdir / "AGENTS.md"
+        path.write_text("old\n")
+        _atomic_write(path, "new\n")
+        self.assertEqual(path.read_text(), "new\n")
+
+    def test_leaves_no_temp_file(self):
+        """The sibling .tmp file is gone after a successful write."""
+        path = self.tmpdir / "index.md"
+        _atomic_write(path, "content\n")
+        self.assertEqual(os.listdir(self.tmpdir), ["index.md"])
+
+    def test_failed_write_keeps_original(self):
+        """A failing write leaves the original file and no temp file."""
+        path = self.tmpdir / "index.md"
+        path.write_text("original\n")
+        with self.assertRaises(TypeError):
+            _atomic_write(path, None)
+        self.assertEqual(path.read_text(), "original\n")
+        self.assertEqual(os.listdir(self.tmpdir), ["index.md"])
+
+    @unittest.skipIf(os.name == "nt", "symlinks need privileges on Windows")
+    def test_symlink_kept_and_target_updated(self):
+        """Writing through a symlink updates the target and keeps the link."""
+        real = self.tmpdir / "shared" / "AGENTS.md"
+        real.parent.mkdir()
+        real.write_text("old\n")
+        link = self.tmpdir / "AGENTS.md"
+        link.symlink_to(real)
+        _atomic_write(link, "new\n")
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(real.read_text(), "new\n")
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_preserves_existing_mode(self):
+        """The replaced file keeps the original permission bits."""
+        path = self.tmpdir / "AGENTS.md"
+        path.write_text("old\n")
+        os.chmod(path, 0o640)
+        _atomic_write(path, "new\n")
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o640)
+
+
 class TestRebuildIndex(unittest.TestCase):
     """Tests for the rebuild_index standalone function."""
 
@@ -675,6 +834,19 @@ class TestRebuildIndex(unittest.TestCase):
         index = (self.tmpdir / "docs" / "index.md").read_text()
         self.assertIn("Dev", index)
 
+    def test_rebuild_index_defaults_role_without_agents_md(self):
+        (self.tmpdir / "AGENTS.md").unlink()
+        rebuild_index(self.tmpdir)
+        index = (self.tmpdir / "docs" / "index.md").read_text()
+        self.assertIn("> Domain knowledge for **Knowledge Base**.", index)
+
+    def test_rebuild_index_ignores_role_heading_far_down(self):
+        (self.tmpdir / "AGENTS.md").write_text("text\n" * 200 + "# Role: Late\n")
+        rebuild_index(self.tmpdir)
+        index = (self.tmpdir / "docs" / "index.md").read_text()
+        self.assertIn("**Knowledge Base**", index)
+        self.assertNotIn("Late", index)
+
     def test_rebuild_index_respects_knowledge_dir_config(self):
         result = rebuild_index(self.tmpdir)
         self.assertEqual(result, "docs/index.md")
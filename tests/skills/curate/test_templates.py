@@ -8,7 +8,9 @@ from unittest.mock import patch
 from templates import (
     MARKER_BEGIN,
     MARKER_END,
+    _frontmatter,
     _slugify,
+    _topic_frontmatter,
     render_agents_md,
     render_agents_md_section,
     render_claude_md,
@@ -65,10 +67,46 @@ class TestSlugify(unittest.TestCase):
     def test_underscores_become_hyphens(self):
         self.assertEqual(_slugify("snake_case_name"), "snake-case-name")
 
+    def test_non_ascii_letters_stripped(self):
+        self.assertEqual(_slugify("Café Menu"), "caf-menu")
+
+    def test_non_ascii_whitespace_becomes_hyphen(self):
+        self.assertEqual(_slugify("foo\u00a0bar\u3000baz"), "foo-bar-baz")
+
 
 FIXED_DATE = datetime.date(2026, 1, 15)
 
 
+@patch("templates.date")
+class TestTopicFrontmatter(unittest.TestCase):
+    """_topic_frontmatter matches the generic _frontmatter rendering."""
+
+    def _generic(self, relevance, depth, **extra):
+        return _frontmatter({
+            "sources": [
+                "url: <!-- Add primary source URL -->\n    title: <!-- Add source title -->",
+            ],
+            "last_validated": FIXED_DATE.isoformat(),
+            "relevance": f'"{relevance}"',
+            "depth": depth,
+            **extra,
+        })
+
+    def test_matches_generic_frontmatter(self, mock_date):
+        mock_date.today.return_value = FIXED_DATE
+        self.assertEqual(
+            _topic_frontmatter("core", "working"),
+            self._generic("core", "working"),
+        )
+
+    def test_extra_fields_keep_order(self, mock_date):
+        mock_date.today.return_value = FIXED_DATE
+        self.assertEqual(
+            _topic_frontmatter("supporting", "working", status="proposal", proposed_by="alice"),
+            self._generic("supporting", "working", status="proposal", proposed_by="alice"),
+        )
+
+
 @patch("templates.date")
 class TestRenderAgentsMd(unittest.TestCase):
     """Tests for render_agents_md."""
@@ -261,6 +299,20 @@ class TestRenderIndexMd(unittest.TestCase):
         result = render_index_md("Generalist", [])
         self.assertIn("# Knowledge Base", result)
 
+    def test_empty_domain_areas_placeholder(self, mock_date):
+        mock_date.today.return_value = FIXED_DATE
+        result = render_index_md("Generalist", iter([]))
+        self.assertIn("No domain areas yet", result)
+        self.assertNotIn("| [Overview]", result)
+
+    def test_accepts_generator(self, mock_date):
+        mock_date.today.return_value = FIXED_DATE
+        areas = self._domain_areas()
+        self.assertEqual(
+            render_index_md("Senior Python Developer", (a for a in areas)),
+            render_index_md("Senior Python Developer", areas),
+        )
+
     def test_includes_topics_when_provided(self, mock_date):
         mock_date.today.return_value = FIXED_DATE
         areas = [
@@ -428,6 +480,11 @@ class TestRenderOverviewMd(unittest.TestCase):
 class TestRenderTopicMd(unittest.TestCase):
     """Tests for render_topic_md (working knowledge)."""
 
+    def test_explicit_today_skips_clock(self, mock_date):
+        result = render_topic_md("Caching", "core", today="2025-06-30")
+        self.assertIn("last_validated: 2025-06-30", result)
+        mock_date.today.assert_not_called()
+
     def test_contains_yaml_frontmatter(self, mock_date):
         mock_date.today.return_value = FIXED_DATE
         result = render_topic_md("API Design", "core")
@@ -801,6 +858,11 @@ class TestRenderDeweyRulesSection(unittest.TestCase):
 class TestRenderCurationPlanMd(unittest.TestCase):
     """Tests for render_curation_plan_md (persistent plan file)."""
 
+    def test_explicit_today(self, mock_date):
+        result = render_curation_plan_md([], today="2025-06-30")
+        self.assertIn("last_updated: 2025-06-30", result)
+        mock_date.today.assert_not_called()
+
     def test_contains_frontmatter(self, mock_date):
         mock_date.today.return_value = FIXED_DATE
         areas = [{"name": "Testing", "slug": "testing", "starter_topics": ["Unit Testing"]}]
@@ -953,6 +1015,13 @@ class TestRenderHooksJson(unittest.TestCase):
         self.assertIn("hook_log_access.py", command)
         self.assertIn("/path/to/kb", command)
 
+    def test_command_with_special_characters_round_trips(self):
+        kb_root = 'C:\\Users\\me\\"kb" café'
+        result = render_hooks_json(plugin_root="/path/to/plugin", knowledge_base_root=kb_root)
+        parsed = json.loads(result)
+        command = parsed["hooks"]["PostToolUse"][0]["hooks"][0]["command"]
+        self.assertTrue(command.endswith(f"--knowledge-base-root {kb_root}"))
+
 
 class TestReturnTypes(unittest.TestCase):
     """All render functions must return strings."""
@@ -6,6 +6,7 @@ import tempfile
 import unittest
 from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
 from check_knowledge_base import run_health_check, run_tier2_prescreening, run_combined_report
 
@@ -189,6 +190,20 @@ class TestRunHealthCheck(unittest.TestCase):
         result = run_health_check(self.tmpdir)
         self.assertEqual(result["summary"]["total_files"], 2)
 
+    def test_per_file_issues_follow_file_order(self):
+        """Per-file issues are grouped per file in sorted discovery order."""
+        area = self.knowledge_base / "area-one"
+        area.mkdir()
+        names = [f"topic-{i:02d}.md" for i in range(12)]
+        for name in reversed(names):
+            _write(area / name, "# No frontmatter at all\n")
+        result = run_health_check(self.tmpdir)
+        fm_files = [
+            Path(i["file"]).name for i in result["issues"]
+            if i["message"] == "Missing frontmatter"
+        ]
+        self.assertEqual(fm_files, names)
+
 
 class TestRunTier2Prescreening(unittest.TestCase):
     """Tests for the run_tier2_prescreening function."""
@@ -258,6 +273,32 @@ class TestRunTier2Prescreening(unittest.TestCase):
         ]
         self.assertEqual(overview_triggers, [])
 
+    def test_queue_follows_file_order(self):
+        """Queue items are grouped per file in sorted discovery order."""
+        area = self.knowledge_base / "area-one"
+        area.mkdir()
+        stale_md = (
+            "---\n"
+            "sources:\n"
+            "  - https://example.com/doc\n"
+            "last_validated: 2020-01-01\n"
+            "relevance: core\n"
+            "depth: overview\n"
+            "---\n"
+            "\n"
+            "# Topic\n"
+        )
+        names = [f"topic-{i:02d}.md" for i in range(12)]
+        for name in reversed(names):
+            _write(area / name, stale_md)
+        result = run_tier2_prescreening(self.tmpdir)
+        drift_files = [
+            Path(i["file"]).name for i in result["queue"]
+            if i["trigger"] == "source_drift"
+        ]
+        self.assertEqual(drift_files, names)
+        self.assertEqual(result["summary"]["files_with_triggers"], len(names))
+
 
 class TestTier2OutputSchema(unittest.TestCase):
     """Validate the output schema of run_tier2_prescreening for workflow consumption."""
@@ -423,6 +464,21 @@ class TestRunCombinedReport(unittest.TestCase):
         self.assertIn("queue", tier2)
         self.assertIn("summary", tier2)
 
+    # ------------------------------------------------------------------
+    # test_discovers_files_once
+    # ------------------------------------------------------------------
+    def test_discovers_files_once(self):
+        """Both tiers reuse the combined report's file discovery."""
+        import check_knowledge_base
+
+        with patch.object(
+            check_knowledge_base, "_discover_md_files",
+            wraps=check_knowledge_base._discover_md_files,
+        ) as discover:
+            result = run_combined_report(self.tmpdir)
+        self.assertEqual(discover.call_count, 1)
+        self.assertEqual(result["tier2"]["summary"]["total_files_scanned"], 2)
+
 
 class TestHistoryIntegration(unittest.TestCase):
     """Tests for automatic history snapshot persistence."""
@@ -500,6 +556,18 @@ class TestIndexMdExclusion(unittest.TestCase):
         filenames = [f.name for f in files]
         self.assertNotIn("index.md", filenames)
 
+    def test_discover_md_files_skips_underscore_paths_and_sorts(self):
+        from check_knowledge_base import _discover_md_files
+        docs = self.tmpdir / "docs"
+        _write(docs / "area" / "nested" / "_hidden" / "deep.md", "# Deep\n")
+        _write(docs / "area" / "_draft.md", "# Draft\n")
+        _write(docs / "area" / "notes.txt", "not markdown\n")
+        _write(docs / "area" / "nested" / "deep.md", "# Deep\n")
+        _write(docs / "area-b" / "topic.md", "# Topic\n")
+        files = _discover_md_files(self.tmpdir, "docs")
+        rel = [f.relative_to(docs).as_posix() for f in files]
+        self.assertEqual(rel, ["area/nested/deep.md", "area/overview.md", "area-b/topic.md"])
+
 
 class TestCheckIndexSync(unittest.TestCase):
     """Tier 1 validator: detect when index.md is out of sync with disk."""
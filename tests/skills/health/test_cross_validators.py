@@ -297,6 +297,25 @@ class TestCheckCurationPlanSync(unittest.TestCase):
         msgs = [i["message"] for i in issues]
         self.assertTrue(any("not in curation plan" in m.lower() for m in msgs))
 
+    def test_checked_items_outside_topic_discovery(self):
+        """Plan items naming overview.md or an underscore dir still resolve on disk."""
+        area = self.knowledge_base / "area-one"
+        area.mkdir()
+        _write(area / "overview.md", _valid_fm("overview") + "\n# Area\n")
+        _write(self.knowledge_base / "_drafts" / "draft.md", "# Draft\n")
+
+        self._write_plan(
+            "---\nlast_updated: 2026-02-15\n---\n\n"
+            "# Curation Plan\n\n"
+            "## area-one\n\n"
+            "- [x] Overview -- core\n\n"
+            "## _drafts\n\n"
+            "- [x] Draft -- core\n"
+        )
+
+        issues = check_curation_plan_sync(self.tmpdir, knowledge_dir_name="docs")
+        self.assertEqual(issues, [])
+
     def test_no_plan_file_skips(self):
         """No plan file -> skip."""
         area = self.knowledge_base / "area-one"
@@ -495,6 +514,35 @@ class TestCheckLinkGraph(unittest.TestCase):
         msgs = [i["message"] for i in issues]
         self.assertTrue(any("orphan" in m.lower() for m in msgs))
 
+    def test_uses_given_md_files(self):
+        """A caller-supplied file list replaces the directory walk."""
+        area = self.knowledge_base / "area-one"
+        area.mkdir()
+        _write(area / "overview.md", _valid_fm("overview") + "\n# Area\n\n## How It's Organized\nNothing.\n")
+        orphan = _write(area / "orphan.md", _valid_fm("working") + "\n# Orphan\n")
+        _write(area / "unlisted.md", _valid_fm("working") + "\n# Unlisted\n")
+
+        issues = check_link_graph(
+            self.tmpdir, knowledge_dir_name="docs",
+            md_files=[area / "overview.md", orphan],
+        )
+        orphan_files = [i["file"] for i in issues if i["message"].startswith("Orphaned file")]
+        self.assertEqual(orphan_files, [str(orphan)])
+
+    def test_underscore_dirs_not_walked(self):
+        """Files under _-prefixed directories are never considered."""
+        area = self.knowledge_base / "area-one"
+        area.mkdir()
+        _write(area / "overview.md", _valid_fm("overview") + "\n# Area\n\n## How It's Organized\nNothing.\n")
+        orphan = _write(area / "orphan.md", _valid_fm("working") + "\n# Orphan\n")
+        proposals = self.knowledge_base / "_proposals"
+        proposals.mkdir()
+        _write(proposals / "draft.md", _valid_fm("working") + "\n# Draft\n")
+
+        issues = check_link_graph(self.tmpdir, knowledge_dir_name="docs")
+        orphan_files = [i["file"] for i in issues if i["message"].startswith("Orphaned file")]
+        self.assertEqual(orphan_files, [str(orphan)])
+
     def test_overview_not_flagged_as_orphan(self):
         """overview.md is an entry point — should not be flagged as orphan."""
         area = self.knowledge_base / "area-one"
@@ -5,6 +5,7 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from history import record_snapshot, read_history
 
@@ -167,6 +168,15 @@ class TestReadHistory(unittest.TestCase):
         history = read_history(self.tmpdir, limit=100)
         self.assertEqual(len(history), 2)
 
+    def test_limit_read_from_tail_across_chunks(self):
+        """Snapshots spanning several read chunks come back whole and in order."""
+        for i in range(20):
+            record_snapshot(self.tmpdir, _tier1_summary(fail_count=i))
+
+        with patch("history._TAIL_BLOCK", 16):
+            history = read_history(self.tmpdir, limit=3)
+        self.assertEqual([h["tier1"]["fail_count"] for h in history], [17, 18, 19])
+
     # ------------------------------------------------------------------
     # test_each_entry_has_expected_keys
     # ------------------------------------------------------------------
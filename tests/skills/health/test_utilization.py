@@ -103,6 +103,29 @@ class TestReadUtilization(unittest.TestCase):
         result = read_utilization(self.tmpdir)
         self.assertEqual(result, {})
 
+    # ------------------------------------------------------------------
+    # test_empty_log_file
+    # ------------------------------------------------------------------
+    def test_empty_log_file(self):
+        """An existing but blank log file returns empty dict."""
+        log_dir = self.tmpdir / ".dewey" / "utilization"
+        log_dir.mkdir(parents=True)
+        (log_dir / "log.jsonl").write_text("\n")
+        self.assertEqual(read_utilization(self.tmpdir), {})
+
+    # ------------------------------------------------------------------
+    # test_non_ascii_and_crlf
+    # ------------------------------------------------------------------
+    def test_non_ascii_and_crlf(self):
+        """UTF-8 paths and CRLF line endings parse from the raw bytes."""
+        log_dir = self.tmpdir / ".dewey" / "utilization"
+        log_dir.mkdir(parents=True)
+        entry = {"file": "topic/café.md", "timestamp": "2026-01-01T00:00:00"}
+        line = json.dumps(entry, ensure_ascii=False)
+        (log_dir / "log.jsonl").write_bytes(f"{line}\r\n{line}\r\n".encode("utf-8"))
+        stats = read_utilization(self.tmpdir)
+        self.assertEqual(stats["topic/café.md"]["count"], 2)
+
     # ------------------------------------------------------------------
     # test_single_reference
     # ------------------------------------------------------------------
@@ -1,5 +1,6 @@
 """Tests for skills.health.scripts.validators — Tier 1 deterministic validators."""
 
+import os
 import shutil
 import tempfile
 import unittest
@@ -8,6 +9,7 @@ from datetime import date, timedelta
 from pathlib import Path
 
 from validators import (
+    _URL_WORKERS,
     check_citation_grounding,
     check_coverage,
     check_cross_references,
@@ -25,6 +27,7 @@ from validators import (
     check_source_accessibility,
     check_source_diversity,
     check_source_urls,
+    collect_existing_paths,
     parse_frontmatter,
 )
 
@@ -83,6 +86,23 @@ class TestParseFrontmatter(unittest.TestCase):
         self.assertEqual(fm.get("relevance"), "core")
         self.assertEqual(fm.get("depth"), "working")
 
+    def test_frontmatter_longer_than_read_window(self):
+        sources = "".join(f"  - https://example.com/{i}\n" for i in range(400))
+        f = _write(
+            self.tmpdir / "a.md",
+            f"---\nsources:\n{sources}depth: working\n---\nBody.\n",
+        )
+        fm = parse_frontmatter(f)
+        self.assertEqual(len(fm["sources"]), 400)
+        self.assertEqual(fm.get("depth"), "working")
+
+    def test_large_body_after_frontmatter(self):
+        f = _write(
+            self.tmpdir / "a.md",
+            "---\ndepth: working\n---\n" + "---\nnot: frontmatter\n" * 2000,
+        )
+        self.assertEqual(parse_frontmatter(f), {"depth": "working"})
+
     def test_parses_date(self):
         f = _write(
             self.tmpdir / "a.md",
@@ -156,6 +176,11 @@ class TestCheckFrontmatter(unittest.TestCase):
         msgs = [i["message"] for i in issues]
         self.assertTrue(any("last_validated" in m for m in msgs))
 
+    def test_given_text_used_instead_of_file(self):
+        f = _write(self.tmpdir / "a.md", "# No frontmatter at all\n")
+        issues = check_frontmatter(f, text=VALID_FRONTMATTER.format(today=self.today))
+        self.assertEqual(issues, [])
+
 
 # ------------------------------------------------------------------
 # check_section_ordering
@@ -199,6 +224,27 @@ class TestCheckSectionOrdering(unittest.TestCase):
         issues = check_section_ordering(f)
         self.assertEqual(issues, [])
 
+    def test_body_mentions_do_not_count_as_headings(self):
+        doc = (
+            f"---\nsources:\n  - https://x.com\nlast_validated: {self.today}\n"
+            "relevance: core\ndepth: working\n---\n\n"
+            "See Key Guidance below.\n\n## In Practice\nConcrete.\n\n"
+            "### Key Guidance notes\nSub.\n\n## Key Guidance\nAbstract.\n"
+        )
+        f = _write(self.tmpdir / "a.md", doc)
+        issues = check_section_ordering(f)
+        self.assertEqual(issues, [])
+
+    def test_missing_heading_passes(self):
+        doc = (
+            f"---\nsources:\n  - https://x.com\nlast_validated: {self.today}\n"
+            "relevance: core\ndepth: working\n---\n\n"
+            "## Key Guidance\nAbstract.\n\nIn Practice we do X.\n"
+        )
+        f = _write(self.tmpdir / "a.md", doc)
+        issues = check_section_ordering(f)
+        self.assertEqual(issues, [])
+
 
 # ------------------------------------------------------------------
 # check_cross_references
@@ -237,6 +283,60 @@ class TestCheckCrossReferences(unittest.TestCase):
         issues = check_cross_references(f, self.tmpdir)
         self.assertEqual(issues, [])
 
+    def test_existing_paths_valid_link_passes(self):
+        area = self.knowledge_base / "area"
+        area.mkdir()
+        _write(area / "target.md", "# Target\n")
+        f = _write(area / "source.md", "See [target](./target.md#intro) for details.\n")
+        existing = collect_existing_paths(self.knowledge_base)
+        issues = check_cross_references(f, self.tmpdir, existing_paths=existing)
+        self.assertEqual(issues, [])
+
+    def test_existing_paths_broken_link_fails(self):
+        area = self.knowledge_base / "area"
+        area.mkdir()
+        f = _write(area / "source.md", "See [missing](no-such-file.md) for details.\n")
+        existing = collect_existing_paths(self.knowledge_base)
+        issues = check_cross_references(f, self.tmpdir, existing_paths=existing)
+        self.assertEqual(len(issues), 1)
+        self.assertIn("no-such-file.md", issues[0]["message"])
+
+    def test_existing_paths_falls_back_outside_index(self):
+        area = self.knowledge_base / "area"
+        area.mkdir()
+        _write(self.tmpdir / "AGENTS.md", "# Role: Test\n")
+        f = _write(area / "source.md", "See [agents](../../AGENTS.md).\n")
+        existing = collect_existing_paths(self.knowledge_base)
+        issues = check_cross_references(f, self.tmpdir, existing_paths=existing)
+        self.assertEqual(issues, [])
+
+    def test_dotdot_through_missing_dir_passes(self):
+        area = self.knowledge_base / "area"
+        area.mkdir()
+        _write(area / "target.md", "# Target\n")
+        f = _write(area / "source.md", "See [target](missing/../target.md).\n")
+        issues = check_cross_references(f, self.tmpdir)
+        self.assertEqual(issues, [])
+
+
+class TestCollectExistingPaths(unittest.TestCase):
+    """Tests for the collect_existing_paths helper."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_includes_files_and_dirs(self):
+        f = _write(self.tmpdir / "area" / "topic.md", "# Topic\n")
+        existing = collect_existing_paths(self.tmpdir)
+        self.assertIn(os.path.abspath(f), existing)
+        self.assertIn(os.path.abspath(self.tmpdir / "area"), existing)
+
+    def test_missing_root_returns_empty(self):
+        self.assertEqual(collect_existing_paths(self.tmpdir / "nope"), set())
+
 
 # ------------------------------------------------------------------
 # check_size_bounds
@@ -282,6 +382,28 @@ class TestCheckSizeBounds(unittest.TestCase):
         issues = check_size_bounds(f)
         self.assertTrue(len(issues) > 0)
 
+    def test_counts_unterminated_last_line(self):
+        # 7 frontmatter lines + 2 body lines, the last without a newline
+        doc = (
+            f"---\nsources:\n  - https://x.com\nlast_validated: {self.today}\n"
+            "relevance: core\ndepth: working\n---\na\nb"
+        )
+        f = _write(self.tmpdir / "a.md", doc)
+        issues = check_size_bounds(f)
+        self.assertEqual(len(issues), 1)
+        self.assertIn("File has 9 lines", issues[0]["message"])
+
+    def test_counts_lines_like_splitlines(self):
+        # A form feed breaks a line for splitlines(), so the body is 2 lines
+        doc = (
+            f"---\nsources:\n  - https://x.com\nlast_validated: {self.today}\n"
+            "relevance: core\ndepth: working\n---\na\x0cb\n"
+        )
+        f = _write(self.tmpdir / "a.md", doc)
+        issues = check_size_bounds(f)
+        self.assertEqual(len(issues), 1)
+        self.assertIn("File has 9 lines", issues[0]["message"])
+
 
 # ------------------------------------------------------------------
 # check_coverage
@@ -340,6 +462,20 @@ class TestCheckCoverage(unittest.TestCase):
         hidden_issues = [i for i in issues if ".dewey" in i.get("file", "")]
         self.assertEqual(hidden_issues, [])
 
+    def test_only_topics_missing_companions_warn(self):
+        area = self.knowledge_base / "area"
+        area.mkdir()
+        _write(area / "overview.md", "# Overview\n")
+        _write(area / "bidding.md", "# Bidding\n")
+        _write(area / "bidding.ref.md", "# Bidding\n")
+        _write(area / "pacing.md", "# Pacing\n")
+        _write(area / "diagram.png", "not markdown")
+        issues = check_coverage(self.tmpdir)
+        self.assertEqual(
+            [(i["file"], i["message"]) for i in issues],
+            [(str(area / "pacing.md"), "Topic 'pacing.md' missing companion pacing.ref.md")],
+        )
+
 
 # ------------------------------------------------------------------
 # check_freshness
@@ -381,6 +517,16 @@ class TestCheckFreshness(unittest.TestCase):
         issues = check_freshness(f, max_age_days=5)
         self.assertTrue(len(issues) > 0)
 
+    def test_explicit_today_used_for_age(self):
+        f = _write(
+            self.tmpdir / "a.md",
+            "---\nlast_validated: 2025-01-01\n---\nBody.\n",
+        )
+        self.assertEqual(check_freshness(f, today=date(2025, 3, 1)), [])
+        issues = check_freshness(f, today=date(2025, 6, 1))
+        self.assertEqual(len(issues), 1)
+        self.assertIn("151 days old", issues[0]["message"])
+
 
 # ------------------------------------------------------------------
 # check_source_urls
@@ -1155,6 +1301,63 @@ class TestCheckSourceAccessibility(unittest.TestCase):
         self.assertEqual(len(issues), 1)
         self.assertIn("timeout", issues[0]["message"].lower())
 
+    def test_multiple_urls_report_in_source_order(self):
+        import urllib.error
+        f = _write(
+            self.tmpdir / "a.md",
+            "---\nsources:\n  - https://example.com/gone\n"
+            "  - https://example.com/ok\n  - https://example.com/missing\n---\n",
+        )
+
+        def fake_urlopen(req, timeout):
+            if req.full_url.endswith("/ok"):
+                return unittest.mock.MagicMock()
+            code = 410 if req.full_url.endswith("/gone") else 404
+            raise urllib.error.HTTPError(req.full_url, code, "Error", {}, None)
+
+        with unittest.mock.patch("urllib.request.urlopen", side_effect=fake_urlopen):
+            issues = check_source_accessibility(f)
+        self.assertEqual(
+            [i["message"] for i in issues],
+            [
+                "Source URL unreachable (410): https://example.com/gone",
+                "Source URL unreachable (404): https://example.com/missing",
+            ],
+        )
+
+    def test_concurrent_files_share_probe_limit(self):
+        import threading
+        import time
+        urls = "".join(f"  - https://example.com/{i}\n" for i in range(3 * _URL_WORKERS))
+        files = [
+            _write(self.tmpdir / f"{name}.md", f"---\nsources:\n{urls}---\n")
+            for name in ("a", "b")
+        ]
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_urlopen(req, timeout):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return unittest.mock.MagicMock()
+
+        with unittest.mock.patch("urllib.request.urlopen", side_effect=fake_urlopen):
+            threads = [
+                threading.Thread(target=check_source_accessibility, args=(f,))
+                for f in files
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertLessEqual(peak, _URL_WORKERS)
+
     def test_placeholder_url_skipped(self):
         f = _write(
             self.tmpdir / "a.md",